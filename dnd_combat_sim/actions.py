@@ -6,6 +6,8 @@ Teleport (Recharge 4-6). The dog magically teleports, along with any equipment i
 class Action:
     """Class to represent an allowed action."""
 
+    __slots__ = ("name", "description")
+
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
@@ -17,6 +19,8 @@ class Action:
 class BonusAction:
     """Class to represent an allowed bonus action."""
 
+    __slots__ = ("name", "description")
+
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
@@ -31,6 +35,8 @@ class TempBonusAction(BonusAction):
     E.g. for one round only, as a result of a trait.
     """
 
+    __slots__ = ("duration",)
+
     def __init__(self, name: str, description: str, duration: int):
         super().__init__(name, description)
         self.duration = duration
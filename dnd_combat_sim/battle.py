@@ -1,6 +1,6 @@
 import logging
 from collections import defaultdict
-from typing import Optional
+from typing import Collection, Optional
 
 from dnd_combat_sim.conditions import TempCondition
 from dnd_combat_sim.creature import Creature
@@ -12,17 +12,27 @@ logger = logging.getLogger(__name__)
 class Team:
     """Class to contain several creatures on a team together."""
 
-    def __init__(self, name: str, creatures: Optional[set[Creature]] = None) -> None:
+    def __init__(self, name: str, creatures: Optional[Collection[Creature]] = None) -> None:
         self.name = name
-        self.creatures = set(creatures) if creatures else set()
+        # A list to keep a stable order for iterating, plus an index for membership checks
+        self.creatures: list[Creature] = list(dict.fromkeys(creatures)) if creatures else []
+        self._index: dict[Creature, int] = {
+            creature: i for i, creature in enumerate(self.creatures)
+        }
+
+    def __contains__(self, creature: Creature) -> bool:
+        return creature in self._index
 
     def add_creature(self, creature: Creature) -> None:
         """Add a creature to the team."""
-        self.creatures.add(creature)
+        if creature not in self._index:
+            self._index[creature] = len(self.creatures)
+            self.creatures.append(creature)
 
     def remove_creature(self, creature: Creature) -> None:
         """Remove a creature from the team."""
-        self.creatures.remove(creature)
+        del self.creatures[self._index.pop(creature)]
+        self._index = {creature: i for i, creature in enumerate(self.creatures)}
 
 
 class Battle:
@@ -32,43 +42,79 @@ class Battle:
         for team in teams:
             for creature in team.creatures:
                 self.team_lookup[creature] = team
-        self.temp_conditions: dict[Creature, list[TempCondition]] = defaultdict(list)
+        self._enemies_of_team: dict[Team, tuple[Creature, ...]] = {}
+        self._rebuild_enemies()
+        # Conditions on each creature, keyed by which condition and who caused it
+        self.temp_conditions: dict[
+            Creature, dict[tuple[Condition, Optional[Creature]], TempCondition]
+        ] = defaultdict(dict)
+        # Bitmask of the kinds of temp condition active on each creature, in sync with the above
+        self._condition_masks: dict[Creature, Condition] = {}
 
         self.round = 0
 
     def add_condition(self, condition: TempCondition) -> None:
         """Add a condition to a creature."""
-        for temp_condition in self.temp_conditions[condition.target]:
-            if (
-                temp_condition.condition == condition.condition
-                and temp_condition.caused_by == condition.caused_by
-            ):
-                logger.debug(f"Condition already active: {condition}")
-                return
+        key = (condition.condition, condition.caused_by)
+        target_conditions = self.temp_conditions[condition.target]
+        if key in target_conditions:
+            logger.debug("Condition already active: %s", condition)
+            return
+
+        target_conditions[key] = condition
+        self._condition_masks[condition.target] = (
+            self._condition_masks.get(condition.target, Condition(0)) | condition.condition
+        )
+
+    def add_creature(self, creature: Creature, team: Team) -> None:
+        """Add a creature to one of the teams in the battle."""
+        team.add_creature(creature)
+        self.team_lookup[creature] = team
+        self._rebuild_enemies()
 
-        self.temp_conditions[condition.target].append(condition)
+    def remove_creature(self, creature: Creature) -> None:
+        """Remove a creature from the battle."""
+        self.team_lookup.pop(creature).remove_creature(creature)
+        self._rebuild_enemies()
 
-    def get_allies(self, creature: Creature) -> set[Creature]:
+    def get_allies(self, creature: Creature) -> list[Creature]:
         """Get all allies of a creature."""
-        creature_team = self.team_lookup[creature]
-        return creature_team.creatures - {creature}
+        return [ally for ally in self.team_lookup[creature].creatures if ally is not creature]
 
-    def get_enemies(self, creature: Creature) -> set[Creature]:
+    def get_enemies(self, creature: Creature) -> tuple[Creature, ...]:
         """Get all enemies of a creature."""
-        creature_team = self.team_lookup[creature]
-        enemy_teams = set(self.teams) - {creature_team}
-        return set(creature for team in enemy_teams for creature in team.creatures)
+        return self._enemies_of_team[self.team_lookup[creature]]
+
+    def get_conditions(self, creature: Creature) -> Condition:
+        """Get all conditions on a creature, both its own (e.g. dead) and temp conditions."""
+        return creature.conditions | self._condition_masks.get(creature, Condition(0))
 
     def has_condition(self, creature: Creature, condition: Condition) -> bool:
         """Check whether a creature has a given condition."""
-        return any(temp_cond.condition == condition for temp_cond in self.temp_conditions[creature])
+        return bool(self._condition_masks.get(creature, Condition(0)) & condition)
 
     def remove_condition(self, condition: TempCondition) -> None:
         """Remove a condition from a creature."""
-        removed = False
-        for temp_condition in self.temp_conditions[condition.target]:
-            if temp_condition == condition:
-                self.temp_conditions[condition.target].remove(temp_condition)
-                removed = True
-        if not removed:
-            raise ValueError(f"Trying to remove a condition that doesn't exist: {condition}")
+        target_conditions = self.temp_conditions[condition.target]
+        try:
+            del target_conditions[(condition.condition, condition.caused_by)]
+        except KeyError:
+            raise ValueError(
+                f"Trying to remove a condition that doesn't exist: {condition}"
+            ) from None
+
+        # Keep the bit while the same kind of condition is still caused by someone else
+        if all(kind != condition.condition for kind, _caused_by in target_conditions):
+            self._condition_masks[condition.target] &= ~condition.condition
+
+    def _rebuild_enemies(self) -> None:
+        """Cache the enemies of each team, so they aren't recomputed every time they're needed."""
+        self._enemies_of_team = {
+            team: tuple(
+                creature
+                for other_team in self.teams
+                if other_team is not team
+                for creature in other_team.creatures
+            )
+            for team in self.teams
+        }
@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
-import abc
-from dataclasses import dataclass
-from typing import Any, Collection, Optional, Union
+from dataclasses import dataclass, field
+from functools import reduce
+from operator import or_
+from typing import TYPE_CHECKING, Any, Callable, Collection, Optional, Union
 
 
 from dnd_combat_sim.creature import Creature
 from dnd_combat_sim.rules import Ability, Condition, Skill
-from dnd_combat_sim.utils import get_distance
+from dnd_combat_sim.utils import is_within_distance
 
+if TYPE_CHECKING:
+    from dnd_combat_sim.battle import Battle
 
-@dataclass(eq=False, repr=False)
-class TempCondition(abc.ABC):
+DEFAULT_END_ON_TARGET_CONDITIONS = frozenset({Condition.dead, Condition.incapacitated})
+# Shared by every grapple rather than building new lists for each one
+GRAPPLE_ESCAPE_ABILITIES = (Skill.acrobatics, Skill.athletics)
+GRAPPLE_CONTESTED_BY = (Skill.athletics,)
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class TempCondition:
     """Class to represent a temporary condition on a creature.
 
     Args:
@@ -25,6 +34,8 @@ class TempCondition(abc.ABC):
         contested_by: Where a contested check can end the condition, which ability the causer rolls.
         end_on_target_conditions: End this condition when the target has any of these conditions.
         end_on_causer_conditions: End this condition when the causer has any of these conditions.
+        extra_check: Any further check for whether the condition has ended, e.g. the grappler and
+            grappled moving apart.
     """
 
     condition: Condition
@@ -33,28 +44,53 @@ class TempCondition(abc.ABC):
     escape_dc: Optional[int] = None
     escape_ability: Optional[Collection[Union[Ability, Skill]]] = None
     escape_modifiers: Optional[dict[str, Any]] = None
-    contested_by: Optional[list[Ability]] = None
+    contested_by: Optional[Collection[Union[Ability, Skill]]] = None
     on_action: bool = False
-    end_on_target_conditions: Optional[Collection[Condition]] = (
-        Condition.dead,
-        Condition.incapacitated,
-    )
-    end_on_causer_conditions: Optional[Collection[Condition]] = ()
-
-    def check_if_condition_ended(self, temp_conditions: dict[Creature, TempCondition]) -> bool:
+    end_on_target_conditions: Optional[Collection[Condition]] = DEFAULT_END_ON_TARGET_CONDITIONS
+    end_on_causer_conditions: Optional[Collection[Condition]] = frozenset()
+    extra_check: Optional[Callable[[TempCondition], bool]] = None
+    # Bitmasks of the end_on_* conditions, to test against all conditions on a creature
+    _end_on_target_mask: Condition = field(init=False, default=Condition(0))
+    _end_on_causer_mask: Condition = field(init=False, default=Condition(0))
+
+    def __post_init__(self) -> None:
+        # Frozensets so checking whether the condition has ended is a set operation. The defaults
+        # already are, so only convert conditions passed in as other collections
+        if not isinstance(self.end_on_target_conditions, frozenset):
+            self.end_on_target_conditions = frozenset(self.end_on_target_conditions or ())
+        if not isinstance(self.end_on_causer_conditions, frozenset):
+            self.end_on_causer_conditions = frozenset(self.end_on_causer_conditions or ())
+        self._end_on_target_mask = reduce(or_, self.end_on_target_conditions, Condition(0))
+        self._end_on_causer_mask = reduce(or_, self.end_on_causer_conditions, Condition(0))
+
+    def check_if_condition_ended(self, battle: Battle) -> bool:
         """Check whether the condition has ended for any reason, e.g. the target is dead."""
-        conditions_on_target = temp_conditions[self.target]
-        for condition in conditions_on_target:
-            if condition in self.end_on_target_conditions:
-                return True
+        if battle.get_conditions(self.target) & self._end_on_target_mask:
+            return True
 
-        if self.caused_by is not None:
-            causer_conditions = temp_conditions[self.caused_by]
-            for condition in causer_conditions:
-                if condition in self.end_on_causer_conditions:
-                    return True
+        if self.caused_by is not None and (
+            battle.get_conditions(self.caused_by) & self._end_on_causer_mask
+        ):
+            return True
 
-        return False
+        return self.extra_check is not None and self.extra_check(self)
+
+    def try_to_end_condition(
+        self,
+        target_modifiers: Optional[dict[str, Any]] = None,
+        caused_by_modifiers: Optional[dict[str, Any]] = None,
+    ) -> bool:
+        """Attempt to end the condition as an action, against the escape DC if there is one or
+        else a check contested by the causer.
+        """
+        target_modifiers = target_modifiers or {}
+        caused_by_modifiers = caused_by_modifiers or {}
+        escape_dc = self.escape_dc
+        if escape_dc is None:
+            escape_dc = self.caused_by.roll_check(self.contested_by, **caused_by_modifiers)
+
+        rolled = self.target.roll_check(self.escape_ability, **target_modifiers)
+        return rolled >= escape_dc
 
     def __eq__(self, other: object) -> bool:
         """Check if two TempConditions are equal."""
@@ -66,6 +102,10 @@ class TempCondition(abc.ABC):
             and self.caused_by == other.caused_by
         )
 
+    def __hash__(self) -> int:
+        # Consistent with __eq__. Creatures hash by identity, which is stable within a battle
+        return hash((self.condition, self.target, self.caused_by))
+
     def __repr__(self) -> str:
         ret = f"Condition({self.target.name} {self.condition.name}"
         if self.caused_by:
@@ -74,54 +114,13 @@ class TempCondition(abc.ABC):
         return ret
 
 
-class Grappled(TempCondition):
-    """Class to represent being grappled.
-
-    Speed is reduced to 0, including any bonuses that apply.
-
-    Ends if:
-    - Creature uses its action to succeed on an acrobatics or athletics check contested by the
-      grappler's athletics
-    - Grappler is incapacitated/killed
-    - Either creature gets hurled away, e.g. by thunderwave
-    """
-
-    def __init__(self, target: Creature, caused_by: Creature) -> None:
-        super().__init__(
-            condition=Condition.grappled,
-            target=target,
-            caused_by=caused_by,
-            escape_ability=[Skill.acrobatics, Skill.athletics],
-            contested_by=[Skill.athletics],
-            on_action=True,
-        )
-
-    def check_if_condition_ended(self, temp_conditions: dict[Creature, TempCondition]) -> bool:
-        """Check whether the condition has ended, either because of another condition on the
-        grappler/grappled, e.g. incapacitated, or because they've somehow moved apart.
-        """
-        if super().check_if_condition_ended(temp_conditions):
-            return True
+def _out_of_reach(condition: TempCondition) -> bool:
+    """Whether the target and the causer have somehow moved more than 5 ft apart."""
+    return not is_within_distance(condition.target.position, condition.caused_by.position, 5)
 
-        return get_distance(self.target, self.caused_by) > 5
 
-    def try_to_end_condition(
-        self,
-        target_modifiers: Optional[dict[str, Any]] = None,
-        caused_by_modifiers: Optional[dict[str, Any]] = None,
-    ) -> bool:
-        """Attempt to end the condition as an action."""
-        target_modifiers = target_modifiers or {}
-        caused_by_modifiers = caused_by_modifiers or {}
-        escape_dc = self.caused_by.roll_check(self.contested_by, **caused_by_modifiers)
-
-        rolled = self.target.roll_check([Skill.acrobatics, Skill.athletics], **target_modifiers)
-        if rolled >= escape_dc:
-            return True
-
-
-class Grappling(TempCondition):
-    """Class to represent grappling another creature.
+def make_grappled(target: Creature, caused_by: Creature) -> TempCondition:
+    """Being grappled.
 
     Speed is reduced to 0, including any bonuses that apply.
 
@@ -131,39 +130,46 @@ class Grappling(TempCondition):
     - Grappler is incapacitated/killed
     - Either creature gets hurled away, e.g. by thunderwave
     """
+    return TempCondition(
+        condition=Condition.grappled,
+        target=target,
+        caused_by=caused_by,
+        escape_ability=GRAPPLE_ESCAPE_ABILITIES,
+        contested_by=GRAPPLE_CONTESTED_BY,
+        on_action=True,
+        extra_check=_out_of_reach,
+    )
 
-    def __init__(self, creature: Creature, caused_by: Creature) -> None:
-        super().__init__(
-            condition=Condition.grappled,
-            creature=creature,
-            caused_by=caused_by,
-            escape_ability=[Skill.acrobatics, Skill.athletics],
-            on_action=True,
-            contested_by=[Skill.athletics],
-        )
-
-    def check_if_condition_ended(self):
-        """Check whether the condition has ended for any reason."""
-        if get_distance(self.target, self.caused_by) > 5:
-            return True
 
-        return super().check_if_condition_ended()
+def make_grappling(target: Creature, caused_by: Creature) -> TempCondition:
+    """Grappling another creature.
 
+    Speed is reduced to 0, including any bonuses that apply. Ends under the same circumstances as
+    being grappled.
+    """
+    return TempCondition(
+        condition=Condition.grappled,
+        target=target,
+        caused_by=caused_by,
+        escape_ability=GRAPPLE_ESCAPE_ABILITIES,
+        on_action=True,
+        contested_by=GRAPPLE_CONTESTED_BY,
+        extra_check=_out_of_reach,
+    )
 
-class PsuedopodGrappled(TempCondition):
-    """Class to represent being grappled by a mimic's pseudopod."""
 
-    def __init__(self, creature: Creature, caused_by: Creature) -> None:
-        super().__init__(
-            condition=Condition.grappled,
-            creature=creature,
-            caused_by=caused_by,
-            escape_dc=13,
-            escape_ability=[Skill.acrobatics, Skill.athletics],
-            end_on_condition=[Condition.dead, Condition.incapacitated],
-        )
+def make_pseudopod_grappled(target: Creature, caused_by: Creature) -> TempCondition:
+    """Being grappled by a mimic's pseudopod."""
+    return TempCondition(
+        condition=Condition.grappled,
+        target=target,
+        caused_by=caused_by,
+        escape_dc=13,
+        escape_ability=GRAPPLE_ESCAPE_ABILITIES,
+        end_on_target_conditions=DEFAULT_END_ON_TARGET_CONDITIONS,
+    )
 
 
 TEMP_CONDITIONS = {
-    "pseudopod_grappled": PsuedopodGrappled,
+    "pseudopod_grappled": make_pseudopod_grappled,
 }
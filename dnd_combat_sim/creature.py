@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import logging
-import random
-from copy import deepcopy
-from dataclasses import dataclass
-from typing import Collection, List, Optional, Sequence, Union
+from copy import copy
+from dataclasses import dataclass, field
+from typing import Any, Collection, List, Optional, Sequence, Union
+
+import numpy as np
 
 from dnd_combat_sim.weapon import Weapon, AttackDamage, AttackRoll, DamageType
-from dnd_combat_sim.dice import roll, roll_d20
+from dnd_combat_sim.dice import choice, roll, roll_d20, roll_d20_batch
 from dnd_combat_sim.rules import (
     Ability,
     Condition,
@@ -21,12 +22,22 @@ from dnd_combat_sim.rules import (
     Skill,
     SKILL_MAPPING,
 )
-from dnd_combat_sim.utils import MONSTERS, get_distance
+from dnd_combat_sim.utils import MONSTERS, get_distance, is_within_distance
 
 logger = logging.getLogger(__name__)
 
+# Monster stat blocks converted once at import, so creating a creature is a dict lookup rather than
+# a pandas label lookup
+MONSTER_STATS: dict[str, dict[str, Any]] = MONSTERS.to_dict("index")
+# Stats parsed into `Creature` arguments, filled in the first time each monster is created
+_MONSTER_TEMPLATES: dict[str, dict[str, Any]] = {}
+# Size of a creature implied by its hit die, e.g. "5d8" -> medium
+HIT_DIE_SIZES = {6: Size.small, 8: Size.medium, 10: Size.large, 12: Size.huge, 20: Size.gargantuan}
+# One record per attack rolled by `Creature.roll_attack_batch`
+ATTACK_ROLL_DTYPE = np.dtype([("d20", np.int64), ("total", np.int64), ("is_crit", np.bool_)])
+
 
-@dataclass
+@dataclass(slots=True)
 class Abilities:
     """Class to store ability scores and modifiers."""
 
@@ -36,16 +47,77 @@ class Abilities:
     int: int
     wis: int
     cha: int
+    # Scores don't change during combat, so work out every modifier once up front
+    modifiers: dict[Ability, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.modifiers = {
+            ability: (getattr(self, ability.name) - 10) // 2 for ability in Ability
+        }
 
     def get_modifier(self, ability: Ability) -> int:
         """Get the modifier for an ability score."""
-        score = getattr(self, ability.name)
-        return (score - 10) // 2
+        return self.modifiers[ability]
 
 
 class Creature:
     """Class to store all state for a creature."""
 
+    __slots__ = (
+        # Stats
+        "name",
+        "ac",
+        "abilities",
+        "actions",
+        "attack_bonus",
+        "cond_immunities",
+        "cr",
+        "creature_subtype",
+        "creature_type",
+        "different_attacks",
+        "has_shield",
+        "hit_die",
+        "hp",
+        "immunities",
+        "make_death_saves",
+        "max_hp",
+        "num_attacks",
+        "num_hands",
+        "num_hit_die",
+        "position",
+        "proficiency",
+        "resistances",
+        "save_proficiencies",
+        "senses",
+        "size",
+        "skill_expertises",
+        "skill_proficiencies",
+        "speed",
+        "speed_fly",
+        "speed_hover",
+        "speed_swim",
+        "traits",
+        "vulnerabilities",
+        "weapons",
+        # Combat stuff
+        "remaining_movement",
+        "attack_used",
+        "weapons_used_this_turn",
+        "bonus_action_used",
+        "reaction_used",
+        "conditions",
+        "temp_hp",
+        "death_saves",
+        "_melee_weapons",
+        "_ranged_weapons",
+        "_best_melee_weapon",
+        "_damage_responses",
+        "_two_hands_free",
+        "_expected_damages",
+        "_max_ranges",
+        "_crit_threshold",
+    )
+
     def __init__(
         self,
         name: str,
@@ -135,13 +207,7 @@ class Creature:
             self.hp = self.max_hp = hp
         # Parse size
         if size is None and self.hit_die is not None:
-            size = {
-                6: Size.small,
-                8: Size.medium,
-                10: Size.large,
-                12: Size.huge,
-                20: Size.gargantuan,
-            }[self.hit_die]
+            size = HIT_DIE_SIZES[self.hit_die]
         elif isinstance(size, str):
             size = Size[size]
         self.size = size
@@ -160,34 +226,35 @@ class Creature:
             for attack in attacks
         ]
         # self.weapons.append(Weapon.init("unarmed_strike"))
-        self.cond_immunities = cond_immunities or set()
+        # Stats that are only ever read are frozensets, so copies made by `spawn` can share them
+        self.cond_immunities = frozenset(cond_immunities or ())
         self.creature_subtype = creature_subtype
         self.creature_type = creature_type
         self.different_attacks = different_attacks
         self.has_shield = has_shield
-        self.immunities = immunities or set()
+        self.immunities = self._parse_damage_types(immunities)
         self.make_death_saves = make_death_saves
         self.num_attacks = num_attacks
         self.num_hands = num_hands
         self.position = position
         self.proficiency = proficiency
-        self.resistances = resistances or set()
-        self.save_proficiencies = {
+        self.resistances = self._parse_damage_types(resistances)
+        self.save_proficiencies = frozenset(
             Ability[save] if isinstance(save, str) else save
             for save in (save_proficiencies or [])
             if save
-        }
+        )
         self.senses = senses or set()
-        self.skill_proficiencies = {
+        self.skill_proficiencies = frozenset(
             Skill[skill] if isinstance(skill, str) else skill
             for skill in (skill_proficiencies or [])
             if skill
-        }
-        self.skill_expertises = {
+        )
+        self.skill_expertises = frozenset(
             Skill[skill] if isinstance(skill, str) else skill
             for skill in (skill_expertises or [])
             if skill
-        }
+        )
         self.speed = speed
         self.speed_fly = speed_fly
         self.speed_hover = speed_hover
@@ -195,7 +262,19 @@ class Creature:
         # self.spell_slots_total = spell_slots or {}
         # self.spell_slots = spell_slots_total.copy() if spell_slots
         self.traits = traits or []
-        self.vulnerabilities = vulnerabilities or set()
+        self.vulnerabilities = self._parse_damage_types(vulnerabilities)
+        # How this creature responds to each damage type, indexed by `DamageType`, so taking damage
+        # is one lookup per type rather than checking immunities, vulnerabilities and resistances
+        self._damage_responses: tuple[Optional[str], ...] = tuple(
+            "immune"
+            if dtype in self.immunities
+            else "vulnerable"
+            if dtype in self.vulnerabilities
+            else "resistant"
+            if dtype in self.resistances
+            else None
+            for dtype in DamageType
+        )
 
         # Combat stuff
         self.remaining_movement: int = speed
@@ -203,10 +282,30 @@ class Creature:
         self.weapons_used_this_turn: set[str] = set()
         self.bonus_action_used: bool = False
         self.reaction_used: bool = False
-        self.conditions: set[Condition] = set()
+        self.conditions = Condition(0)  # Bitmask of all current conditions
         self.temp_hp: int = 0
         self.death_saves: dict[str, int] = {"successes": 0, "failures": 0}
 
+        # Lowest d20 roll that crits. Other rules can lower it, e.g. certain feats
+        self._crit_threshold = 20
+        # Hands and shield don't change during combat, so check for two free hands once
+        self._two_hands_free = self._get_num_free_hands() >= 2
+        # Average damage of each weapon on a hit, which only depends on stats fixed at creation
+        self._expected_damages = {
+            weapon.name: weapon.expected_damage(
+                two_handed=self._two_hands_free, damage_modifier=self._get_attack_modifier(weapon)
+            )
+            for weapon in self.weapons
+        }
+        # Furthest each weapon can attack, at long range for ranged weapons
+        self._max_ranges = {
+            weapon.name: weapon.range[1]
+            if weapon.range is not None
+            else 10
+            if weapon.reach
+            else 5
+            for weapon in self.weapons
+        }
         self._melee_weapons = [attack for attack in self.weapons if attack.melee]
         self._ranged_weapons = [attack for attack in self.weapons if not attack.melee]
         self._best_melee_weapon = self._set_best_melee_weapon()
@@ -220,21 +319,32 @@ class Creature:
         start_x: int = 0,
     ) -> Creature:
         """Create a creature from a monster template."""
-        stats = MONSTERS.loc[monster].to_dict()
+        template = _MONSTER_TEMPLATES.get(monster)
+        if template is None:
+            template = _MONSTER_TEMPLATES[monster] = cls._parse_monster_stats(monster)
 
-        # Parse fields that need it
+        stats = dict(template)
         stats["name"] = monster.title() if name is None else name.title()
-        stats["abilities"] = [stats.pop(ability) for ability in Ability.__members__]
-        size = Size[stats["size"]]
-        stats["size"] = size
-        stats["attacks"] = [
-            Weapon.init(attack, size=size) for attack in (stats["attacks"] or "").split(",")
-        ]
-        stats["creature_type"] = CreatureType[stats["creature_type"]]
+        # Weapons track ammunition, so each creature needs its own
+        stats["attacks"] = [Weapon.init(attack, size=stats["size"]) for attack in stats["attacks"]]
         stats["make_death_saves"] = make_death_saves
         stats["position"] = Position(start_x, 0)
+
+        return cls(**stats)
+
+    @staticmethod
+    def _parse_monster_stats(monster: str) -> dict[str, Any]:
+        """Parse a monster's stats from _monsters.csv_ into arguments for `Creature`.
+
+        Collections are tuples, since the parsed stats are cached and shared between creatures.
+        """
+        stats = dict(MONSTER_STATS[monster])  # Copy since fields are parsed in place
+        stats["abilities"] = [stats.pop(ability) for ability in Ability.__members__]
+        stats["size"] = Size[stats["size"]]
+        stats["attacks"] = tuple((stats["attacks"] or "").split(","))
+        stats["creature_type"] = CreatureType[stats["creature_type"]]
         if stats["senses"]:
-            stats["senses"] = [Sense[sense] for sense in stats["senses"].split(",")]
+            stats["senses"] = tuple(Sense[sense] for sense in stats["senses"].split(","))
 
         for key in [
             "cond_immunities",
@@ -246,13 +356,13 @@ class Creature:
             "traits",
             "vulnerabilities",
         ]:
-            stats[key] = stats[key].split(",") if stats[key] else None
+            stats[key] = tuple(stats[key].split(",")) if stats[key] else None
 
-        return cls(**stats)
+        return stats
 
     def _set_best_melee_weapon(self):
         """Reserved weapon for melee attacks that shouldn't be thrown."""
-        logger.debug(f"{self.name} start best_melee_weapon()")
+        logger.debug("%s start best_melee_weapon()", self.name)
         best_melee_damage = 0
         best_melee_weapon = None
         for weapon, expected_damage in self._get_expected_damages(self._melee_weapons):
@@ -273,36 +383,39 @@ class Creature:
 
         For now just attack if possible, else dash toward nearest enemy.
         """
-        logger.debug(f"{self.name} start choose_action()")
+        logger.debug("%s start choose_action()", self.name)
         # available_actions = ["disengage", "dodge", "hide", "search"]
         _closest_targets, distance = self._get_closest_enemies(targets)
 
+        # Only one option each for now, so nothing to choose between yet
+        bonus_action = None
         if self._can_attack(distance):
-            logger.debug(f"{self.name} choosing to attack")
-            available_actions = ["attack"]
-        else:
-            logger.debug(f"{self.name} can't attack, dashing")
-            self.remaining_movement += self.speed
-            available_actions = ["dash"]
+            logger.debug("%s choosing to attack", self.name)
+            return "attack", bonus_action
 
-        action = random.choice(available_actions)
-        bonus_action = random.choice([None])
-
-        return action, bonus_action
+        logger.debug("%s can't attack, dashing", self.name)
+        self.remaining_movement += self.speed
+        return "dash", bonus_action
 
     def choose_attack(self, targets: list[Creature]) -> Optional[tuple[Creature, Weapon, bool]]:
         """Choose a target to attack, a weapon to use, and whether to throw it (if melee)."""
-        logger.debug(f"{self.name} start choose_attack()")
-        target = random.choice(targets)
+        logger.debug("%s start choose_attack()", self.name)
+        target = choice(targets)
         distance = get_distance(self.position, target.position)
 
-        attack_options = self._get_attack_options(distance=distance)
-        melee_options = [opt for opt in attack_options if opt[0].melee]
-        ranged_options = [opt for opt in attack_options if opt[0].range is not None]
+        # Split options into melee and ranged in one pass, tracking the best melee damage
+        melee_options = []
+        ranged_options = []
+        best_melee_damage = 0
+        for option in self._get_attack_options(distance=distance):
+            if option[0].melee:
+                melee_options.append(option)
+                best_melee_damage = max(best_melee_damage, option[1])
+            if option[0].range is not None:
+                ranged_options.append(option)
 
         # If in melee range, only use ranged weapons that trump any melee option
         if distance <= 5:
-            best_melee_damage = max(melee[1] for melee in melee_options)
             ranged_options = [opt for opt in ranged_options if opt[1] > best_melee_damage]
 
         attack_options = melee_options + ranged_options
@@ -310,7 +423,7 @@ class Creature:
             return None
 
         expected_damages = [attack[1] for attack in attack_options]
-        weapon_choice = random.choices(melee_options + ranged_options, weights=expected_damages)[0]
+        weapon_choice = choice(attack_options, weights=expected_damages)
 
         return target, weapon_choice[0], weapon_choice[2]
 
@@ -325,7 +438,7 @@ class Creature:
         3. Prioritise doing the most expected damage
         4. Always be prepared for melee combat
         """
-        logger.debug(f"{self.name} start choose_movement()")
+        logger.debug("%s start choose_movement()", self.name)
         if self.remaining_movement == 0:
             logger.debug("No more movement, staying")
             return None, 0
@@ -333,14 +446,14 @@ class Creature:
         # Choose closest target to attack (P1)
         enemies, distance = self._get_closest_enemies(enemies)
         if distance <= 5:  # If in melee range of any enemy, don't move (P1, P2)
-            logger.debug(f"Already in melee range ({distance}), staying")
+            logger.debug("Already in melee range (%s), staying", distance)
             return None, 0
 
         ideal_distance = None
         if distance <= 10:
             in_enemy_reach = any(weapon.reach for enemy in enemies for weapon in enemy.weapons)
             if in_enemy_reach:
-                logger.debug(f"In enemy reach range ({distance}), deciding between 5ft and 10ft")
+                logger.debug("In enemy reach range (%s), deciding between 5ft and 10ft", distance)
                 # Decide whether to close in for 5ft melee or attack from 10 ft
                 attack_options_5_ft = self._get_attack_options(10)
                 attack_options_10_ft = self._get_attack_options(10)
@@ -348,29 +461,33 @@ class Creature:
                 best_damage_10_ft = max(attack[1] for attack in attack_options_10_ft)
                 if best_damage_10_ft > best_damage_5_ft:
                     logger.debug(
-                        f"Ideal distance 10 ft, {best_damage_10_ft=} vs {best_damage_5_ft=}"
+                        "Ideal distance 10 ft, best_damage_10_ft=%r vs best_damage_5_ft=%r",
+                        best_damage_10_ft,
+                        best_damage_5_ft,
                     )
                     ideal_distance = 10
                 else:
                     logger.debug(
-                        f"Ideal distance 5 ft, {best_damage_10_ft=} vs {best_damage_5_ft=}"
+                        "Ideal distance 5 ft, best_damage_10_ft=%r vs best_damage_5_ft=%r",
+                        best_damage_10_ft,
+                        best_damage_5_ft,
                     )
                     ideal_distance = 5
 
         if ideal_distance is None:
             # If not in enemy melee range, figure out the ideal distance to be (P1, P3)
             # Just move in the x direction for now
-            logger.debug(f"{self.name} choosing movement by finding ideal distance")
+            logger.debug("%s choosing movement by finding ideal distance", self.name)
             ideal_distance = self._get_ideal_distance()
 
-        target = random.choice(enemies)
+        target = choice(enemies)
         # E.g. currently 30 ft away, want to be 5 ft away -> move 25 ft closer
         ideal_movement = distance - ideal_distance  # Positive for toward enemy, negative for away
         max_movement = int(min(abs(ideal_movement), self.remaining_movement))
         movement = -max_movement if ideal_movement < 0 else max_movement
 
         direction = "towards" if movement > 0 else "away from"
-        logger.debug(f"Movement chosen: {abs(movement)} ft {direction} {target.name}")
+        logger.debug("Movement chosen: %s ft %s %s", abs(movement), direction, target.name)
         value = movement if self.position.x < target.position.x else -movement
         # if self.name.lower() == "skeleton" and abs(movement) > 30:
         #     breakpoint()
@@ -381,27 +498,31 @@ class Creature:
     ) -> tuple[AttackDamage, dict[DamageType:str]]:
         """Apply immunities, resistances and vulnerabilities to update attack damage."""
         modifiers_applied = {}
-        attack_damage = deepcopy(attack_damage)
-        for dtype in attack_damage.damages:
-            if dtype in self.immunities:
-                attack_damage.damages.pop(dtype)
-                modifiers_applied[dtype] = "immune"
-            elif dtype in self.vulnerabilities:
-                attack_damage.damages[dtype] *= 2
-                modifiers_applied[dtype] = "vulnerable"
-            elif dtype in self.resistances:
-                attack_damage.damages[dtype] //= 2
-                modifiers_applied[dtype] = "resistant"
+        attack_damage = attack_damage.copy()
+        amounts = attack_damage.amounts
+        damage_types = []
+        for dtype in attack_damage.damage_types:
+            response = self._damage_responses[dtype]
+            if response is not None:
+                modifiers_applied[dtype] = response
+                if response == "immune":
+                    amounts[dtype] = 0
+                    continue
+                if response == "vulnerable":
+                    amounts[dtype] *= 2
+                else:
+                    amounts[dtype] //= 2
+            damage_types.append(dtype)
+        attack_damage.damage_types = damage_types
 
         return attack_damage, modifiers_applied
 
     def heal(self, amount: int, wake_up: bool = True) -> None:
         """Recover hit points."""
         self.hp = min(self.hp + amount, self.max_hp)
-        self.conditions.discard(Condition.dead)
-        self.conditions.discard(Condition.dying)
+        self.conditions &= ~(Condition.dead | Condition.dying)
         if wake_up:
-            self.conditions.discard(Condition.unconscious)
+            self.conditions &= ~Condition.unconscious
 
     def move(self, new_position: Position) -> None:
         """Move the creature a given location."""
@@ -415,7 +536,7 @@ class Creature:
             )
         else:
             self.remaining_movement -= distance
-        logger.debug(f"{self.name} moved from {from_pos} to {new_position}")
+        logger.debug("%s moved from %s to %s", self.name, from_pos, new_position)
 
     def roll_attack(
         self,
@@ -432,18 +553,33 @@ class Creature:
             weapon.quantity -= 1
             if weapon.quantity == 0:
                 span = " ammo for" if weapon.ammunition else ""
-                logger.info(f"{self.name}'s last{span} {weapon.name}")
+                logger.info("%s's last%s %s", self.name, span, weapon.name)
 
         # Roll to attack
         rolled = roll_d20(advantage=advantage, disadvantage=disadvantage)
+        modifier = self._get_to_hit_modifier(weapon)
 
-        if self.attack_bonus is not None:
-            modifier = self.attack_bonus
-        else:
-            modifier = self._get_attack_modifier(weapon)
-            modifier += self.proficiency if weapon.proficient else 0
+        return AttackRoll(rolled, modifier, rolled >= self._crit_threshold, weapon)
+
+    def roll_attack_batch(
+        self,
+        weapon: Weapon,
+        num_trials: int,
+        advantage: bool = False,
+        disadvantage: bool = False,
+    ) -> np.ndarray:
+        """Roll `num_trials` attacks with a weapon in one vectorised call, e.g. to estimate hit
+        chances. Unlike `roll_attack`, this doesn't use up the attack or any ammunition.
 
-        return AttackRoll(rolled, modifier, self._is_crit(rolled), weapon)
+        Returns:
+            A structured array with fields `d20`, `total` and `is_crit` for each trial.
+        """
+        rolled = roll_d20_batch(num_trials, advantage=advantage, disadvantage=disadvantage)
+        attacks = np.empty(num_trials, dtype=ATTACK_ROLL_DTYPE)
+        attacks["d20"] = rolled
+        attacks["total"] = rolled + self._get_to_hit_modifier(weapon)
+        attacks["is_crit"] = rolled >= self._crit_threshold
+        return attacks
 
     def roll_check(
         self,
@@ -466,13 +602,21 @@ class Creature:
         damage_modifier = self._get_attack_modifier(attack)
 
         damage = attack.roll_damage(
-            two_handed=self._get_num_free_hands() >= 2,
+            two_handed=self._two_hands_free,
             crit=crit,
             damage_modifier=damage_modifier,
-            use_average=False,
         )
         return damage
 
+    def roll_damage_batch(self, attack: Weapon, num_trials: int, crit: bool = False) -> np.ndarray:
+        """Roll total damage for `num_trials` hits with an attack in one vectorised call."""
+        return attack.roll_damage_batch(
+            num_trials,
+            two_handed=self._two_hands_free,
+            crit=crit,
+            damage_modifier=self._get_attack_modifier(attack),
+        )
+
     def roll_death_save(self) -> tuple[int, str]:
         """Roll a death saving throw.
 
@@ -490,7 +634,7 @@ class Creature:
             self.death_saves["successes"] += 1
             if self.death_saves["successes"] == 3:
                 result = "stabilised"
-                self.conditions.add(Condition.stable)
+                self.conditions |= Condition.stable
                 self._reset_death_saves()
         elif death_save == 20:
             result = "critical success"
@@ -505,7 +649,7 @@ class Creature:
 
     def roll_initiative(self):
         """Roll initiative for the creature."""
-        return roll_d20() + self.abilities.get_modifier(Ability.dex)
+        return roll_d20() + self.abilities.modifiers[Ability.dex]
 
     def roll_saving_throw(
         self, ability: Ability, advantage: bool = False, disadvantage: bool = False
@@ -513,7 +657,7 @@ class Creature:
         """Roll a saving throw for a given ability."""
 
         save = roll_d20(advantage=advantage, disadvantage=disadvantage)
-        modifier = self.abilities.get_modifier(ability)
+        modifier = self.abilities.modifiers[ability]
         if ability in self.save_proficiencies:
             modifier += self.proficiency
 
@@ -521,7 +665,15 @@ class Creature:
 
     def spawn(self, name: Optional[str] = None) -> Creature:
         """Create a new copy of this creature with the same stas but statuses reset."""
-        new_creature = deepcopy(self)
+        # Shallow copy shares stats that never change in combat, e.g. abilities and proficiencies.
+        # Only weapons need copying, since ammunition gets used up
+        new_creature = copy(self)
+        new_creature.weapons = [copy(weapon) for weapon in self.weapons]
+        new_creature._melee_weapons = [attack for attack in new_creature.weapons if attack.melee]
+        new_creature._ranged_weapons = [
+            attack for attack in new_creature.weapons if not attack.melee
+        ]
+        new_creature._best_melee_weapon = new_creature._set_best_melee_weapon()
         if name is not None:
             new_creature.name = name
 
@@ -530,10 +682,12 @@ class Creature:
             new_creature.hp = new_creature.max_hp = self._roll_hit_points()
         else:
             new_creature.hp = new_creature.max_hp
+        # Reset before start_turn, so a dying template doesn't roll death saves into the dict it
+        # shares with the copy
+        new_creature.conditions = Condition(0)
+        new_creature.death_saves = {"successes": 0, "failures": 0}
         new_creature.start_turn()
         # new_creature.spell_slots = self.total_spell_slots.copy()
-        new_creature.conditions = set()
-        new_creature.death_saves = {"successes": 0, "failures": 0}
 
         return new_creature
 
@@ -548,11 +702,14 @@ class Creature:
         if Condition.dying in self.conditions:
             value, result = self.roll_death_save()
             logger.debug(
-                f"{self.name} rolled a {value} on their death saving throw: {result}\n"
-                f"{self.death_saves}."
+                "%s rolled a %s on their death saving throw: %s\n%s.",
+                self.name,
+                value,
+                result,
+                self.death_saves,
             )
             if result == "death":
-                logger.debug(f"{self.name} is DEAD!")
+                logger.debug("%s is DEAD!", self.name)
 
     def take_damage(
         self,
@@ -560,29 +717,31 @@ class Creature:
         crit: bool = False,
     ) -> DamageOutcome:
         """Take damage from a hit and return the outcome of the damage."""
+        # Called for every hit, so work on locals and write HP back once
         total_damage = damage.total
-
-        damage_taken = min(total_damage, self.hp)
-        excess_damage = total_damage - damage_taken
-        self.hp -= damage_taken
+        hp = self.hp
+        damage_taken = total_damage if total_damage < hp else hp
+        hp -= damage_taken
+        self.hp = hp
 
         # Check for instant death
-        if excess_damage > self.max_hp:
+        if total_damage - damage_taken > self.max_hp:
             self._die()
             return DamageOutcome.instant_death
 
-        if self.hp > 0:
+        if hp > 0:
             return DamageOutcome.alive
 
         if Condition.dying in self.conditions:
             # Already making death saving throws, get failure(s) instead of damage
-            self.death_saves["failures"] += 1 if not crit else 2
-            if self.death_saves["failures"] >= 3:
+            death_saves = self.death_saves
+            death_saves["failures"] += 2 if crit else 1
+            if death_saves["failures"] >= 3:
                 return self._die()
             return DamageOutcome.still_dying
 
         if self.make_death_saves:
-            self.conditions.update([Condition.unconscious, Condition.dying])
+            self.conditions |= Condition.unconscious | Condition.dying
             return DamageOutcome.knocked_out
         return self._die()
 
@@ -593,7 +752,7 @@ class Creature:
         min_range = distance - self.remaining_movement
         usable_weapons = self._usable_weapons(self.weapons, distance_from_target=min_range)
         if not usable_weapons:
-            logger.debug(f"{self.name} has no usable weapons at {distance} ft")
+            logger.debug("%s has no usable weapons at %s ft", self.name, distance)
 
         return len(usable_weapons) > 0
 
@@ -603,16 +762,16 @@ class Creature:
         Must have at least 1 free hand, be within reach, and target can't be more than 1 size
         larger.
         """
-        return not any(
-            ((target.size - self.size) > 1),
-            (self._get_num_free_hands() < 1),
-            (get_distance(self.position, target.position) > 5),
-        )
+        # Cheapest checks first, so the distance is only worked out when it matters
+        if target.size - self.size > 1:
+            return False
+        if self._get_num_free_hands() < 1:
+            return False
+        return is_within_distance(self.position, target.position, 5)
 
     def _die(self) -> str:
-        self.conditions.add(Condition.dead)
-        self.conditions.discard(Condition.dying)
-        self.conditions.discard(Condition.unconscious)
+        self.conditions |= Condition.dead
+        self.conditions &= ~(Condition.dying | Condition.unconscious)
         # logger.info(f"{self.name} died")
 
         return DamageOutcome.dead
@@ -625,12 +784,20 @@ class Creature:
         - dexterity for ranged attacks
           - or strength for thrown weapons, or either for thrown finesse weapons
         """
+        modifiers = self.abilities.modifiers
         if attack.finesse:
-            return self._get_modifier([Ability.str, Ability.dex])
+            return max(modifiers[Ability.str], modifiers[Ability.dex])
         if attack.melee:
-            return self._get_modifier(Ability.str)
+            return modifiers[Ability.str]
+
+        return modifiers[Ability.dex]
 
-        return self._get_modifier(Ability.dex)
+    def _get_to_hit_modifier(self, attack: Weapon) -> int:
+        """Get the total modifier added to attack rolls with a weapon."""
+        if self.attack_bonus is not None:
+            return self.attack_bonus
+        modifier = self._get_attack_modifier(attack)
+        return modifier + self.proficiency if attack.proficient else modifier
 
     def _get_attack_options(
         self, distance: Optional[int] = None
@@ -642,7 +809,7 @@ class Creature:
 
         Return a list of tuples of (weapon, expected damage, whether requires ammo/throwing).
         """
-        logger.debug(f"{self.name} start _get_attack_options({distance=})")
+        logger.debug("%s start _get_attack_options(distance=%r)", self.name, distance)
         attack_options = []
 
         # Expected damage for all weapons, assume no disadvantage
@@ -666,20 +833,24 @@ class Creature:
 
     def _get_closest_enemies(self, enemies: list[Creature]) -> tuple[list[Creature], float]:
         """Return the closest enem(ies) and their distance."""
-        closest_distance = None
+        closest_squared = None
         closest_targets = []
 
+        # Compare squared distances so only the closest needs a square root
+        x, y = self.position.x, self.position.y
         for enemy in enemies:
-            if not isinstance(self.position, Position) or not isinstance(enemy.position, Position):
-                breakpoint()
-            distance = get_distance(self.position, enemy.position)
-            if closest_distance is None or distance < closest_distance:
-                closest_distance = distance
+            dx = enemy.position.x - x
+            dy = enemy.position.y - y
+            squared = dx * dx + dy * dy
+            if closest_squared is None or squared < closest_squared:
+                closest_squared = squared
                 closest_targets = [enemy]
-            elif distance == closest_distance:
+            elif squared == closest_squared:
                 closest_targets.append(enemy)
 
-        return closest_targets, closest_distance
+        if closest_squared is None:
+            return closest_targets, None
+        return closest_targets, closest_squared**0.5
 
     def _get_expected_damages(
         self, weapons: list[Weapon], distance: Optional[float] = None
@@ -692,45 +863,39 @@ class Creature:
         If weapon has a special trait, raise its expected damage to equal whichever weapon has the
         highest raw expected damage.
         """
-        logger.debug(f"{self.name} Getting expected damages for {weapons=} for {distance=}")
-        two_handed = self._get_num_free_hands() >= 2
+        # Lazy %-formatting so weapon reprs are only built if debug logging is enabled
+        logger.debug(
+            "%s Getting expected damages for weapons=%s for distance=%s",
+            self.name,
+            weapons,
+            distance,
+        )
         usable_weapons = self._usable_weapons(weapons, distance_from_target=distance)
         if not usable_weapons:
             return []
 
         weapon_damages = []
         for weapon in usable_weapons:
-            expected_damage = weapon.roll_damage(
-                two_handed=two_handed,
-                damage_modifier=self._get_attack_modifier(weapon),
-                use_average=True,
-            ).total
+            expected_damage = self._expected_damages[weapon.name]
             if distance is None:
-                logger.debug(f"{self.name}: {weapon.name} - {expected_damage} average damage")
-                pass
+                context = ""
             elif distance <= 5:
                 if not weapon.melee:
                     # Disadvantage for using ranged in melee
                     expected_damage /= 2
-                logger.debug(
-                    f"{self.name}: {weapon.name} - {expected_damage} average damage in melee"
-                )
+                context = " in melee"
             else:  # Ranged (or maybe reach)
                 if distance == 10 and weapon.reach:
-                    logger.debug(
-                        f"{self.name}: {weapon.name} - {expected_damage} average reach damage"
-                    )
-                    pass
+                    context = " with reach"
                 elif weapon.range[0] < distance:
                     # Disadvantage for firing at range
                     expected_damage /= 2
-                    logger.debug(
-                        f"{self.name}: {weapon.name} - {expected_damage} average damage at long range"
-                    )
+                    context = " at long range"
                 else:
-                    logger.debug(
-                        f"{self.name}: {weapon.name} - {expected_damage} average damage at range"
-                    )
+                    context = " at range"
+            logger.debug(
+                "%s: %s - %s average damage%s", self.name, weapon.name, expected_damage, context
+            )
             weapon_damages.append([weapon, expected_damage])
 
         # If a weapon has a special trait, assuming it's more valuable than its raw damage suggests
@@ -744,14 +909,16 @@ class Creature:
 
     def _get_ideal_distance(self) -> float:
         """Compute ideal distance from nearest enemy to maximise expected damage dealt."""
-        logger.debug(f"{self.name} start _get_ideal_distance()")
+        logger.debug("%s start _get_ideal_distance()", self.name)
         ideal_weapon = None
         ideal_distance = 5
         max_expected_damage = 0
 
         for weapon, expected_damage in self._get_expected_damages(self.weapons):
             if expected_damage > max_expected_damage:
-                logger.debug(f"New ideal weapon: {weapon.name}, {expected_damage=}")
+                logger.debug(
+                    "New ideal weapon: %s, expected_damage=%r", weapon.name, expected_damage
+                )
                 ideal_weapon = weapon
                 max_expected_damage = expected_damage
                 if weapon == self._best_melee_weapon or weapon.range is None:
@@ -763,14 +930,25 @@ class Creature:
                 if (weapon.range is not None) and (weapon != self._best_melee_weapon):
                     ideal_weapon = weapon
                     ideal_distance = max(ideal_distance, weapon.range[0])
-                    logger.debug(f"New ideal ranged weapon: {weapon.name}, {expected_damage=}")
+                    logger.debug(
+                        "New ideal ranged weapon: %s, expected_damage=%r",
+                        weapon.name,
+                        expected_damage,
+                    )
                 elif weapon.reach:
                     ideal_weapon = weapon
                     ideal_distance = max(ideal_distance, 10)
-                    logger.debug(f"New ideal reach weapon: {weapon.name}, {expected_damage=}")
+                    logger.debug(
+                        "New ideal reach weapon: %s, expected_damage=%r",
+                        weapon.name,
+                        expected_damage,
+                    )
 
         logger.debug(
-            f"Ideal distance is {ideal_distance} ft for {ideal_weapon}, {max_expected_damage=}"
+            "Ideal distance is %s ft for %s, max_expected_damage=%r",
+            ideal_distance,
+            ideal_weapon,
+            max_expected_damage,
         )
 
         return ideal_distance
@@ -794,7 +972,7 @@ class Creature:
                 skill = option
                 ability = SKILL_MAPPING[option]
 
-            modifier = (getattr(self.abilities, ability.name) - 10) // 2
+            modifier = self.abilities.modifiers[ability]
             if skill is not None:
                 if skill in self.skill_expertises:
                     modifier += self.proficiency * 2
@@ -817,19 +995,26 @@ class Creature:
 
         return free_hands
 
-    def _is_crit(self, rolled: int):
-        """Other rules can apply, e.g. with certain feats."""
-        return rolled == 20
+    @staticmethod
+    def _parse_damage_types(
+        damage_types: Optional[Collection[Union[DamageType, str]]]
+    ) -> frozenset[DamageType]:
+        """Convert damage type names, e.g. from _monsters.csv_, to `DamageType`s."""
+        return frozenset(
+            DamageType[dtype] if isinstance(dtype, str) else dtype
+            for dtype in (damage_types or [])
+            if dtype
+        )
 
     def _reset_death_saves(self, wake_up: bool = False):
         self.death_saves = {"successes": 0, "failures": 0}
-        self.conditions.discard(Condition.dying)
+        self.conditions &= ~Condition.dying
         if wake_up:
-            self.conditions.discard(Condition.unconscious)
+            self.conditions &= ~Condition.unconscious
 
     def _roll_hit_points(self) -> int:
         dice = f"{self.num_hit_die}d{self.hit_die}"
-        const_mod = self.abilities.get_modifier(Ability.con)
+        const_mod = self.abilities.modifiers[Ability.con]
         hp = roll(dice) + const_mod * self.num_hit_die
 
         return int(max(hp, 1))
@@ -846,27 +1031,34 @@ class Creature:
         3. If `self.different_attacks == True`, not have been used already this turn
         4. If `distance_from_target` is not None, be at least in long range
         """
-        two_hands_free = self._get_num_free_hands() >= 2
         usable_weapons = []
         for weapon in weapons:
             if weapon.quantity < 1:
                 continue
-            if weapon.two_handed_damage and not weapon.damage and not two_hands_free:
+            if weapon.two_handed_damage and not weapon.damage and not self._two_hands_free:
                 continue
             if self.different_attacks and weapon.name in self.weapons_used_this_turn:
                 continue
-            if distance_from_target is not None:
-                if weapon.range is not None:
-                    max_range = weapon.range[1]
-                elif weapon.reach:
-                    max_range = 10
-                else:
-                    max_range = 5
-                if distance_from_target > max_range:
-                    continue
+            if (
+                distance_from_target is not None
+                and distance_from_target > self._max_ranges[weapon.name]
+            ):
+                continue
             usable_weapons.append(weapon)
-        logger.debug(f"{self.name} Usable weapons: {usable_weapons} {distance_from_target=}")
+        logger.debug(
+            "%s Usable weapons: %s distance_from_target=%s",
+            self.name,
+            usable_weapons,
+            distance_from_target,
+        )
         return usable_weapons
 
+    def __copy__(self) -> Creature:
+        # Copy the slots directly, much faster than the generic copy protocol for slotted classes
+        new_creature = object.__new__(type(self))
+        for attr in Creature.__slots__:
+            setattr(new_creature, attr, getattr(self, attr))
+        return new_creature
+
     def __repr__(self) -> str:
         return f"{self.name}: {self.hp}/{self.max_hp} hp at {self.position}"
@@ -0,0 +1,240 @@
+"""Module to store many copies of a creature as parallel arrays, e.g. one per simulated fight."""
+
+# pylint: disable=protected-access
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from dnd_combat_sim.creature import Creature
+from dnd_combat_sim.dice import roll_batch, roll_d20_batch
+from dnd_combat_sim.rules import Ability, Condition
+
+# How each damage response scales damage, as (numerator, denominator) so that resistance rounds
+# down the same way as `Creature.get_damage_taken`
+_RESPONSE_SCALES = {None: (1, 1), "immune": (0, 1), "vulnerable": (2, 1), "resistant": (1, 2)}
+
+
+@dataclass(eq=False)
+class CreatureBatch:
+    """Many independent copies of the same creature, with the state that changes in combat stored
+    as parallel arrays so damage can be applied to every copy in one vectorised pass.
+
+    Args:
+        template: The creature the batch was copied from, for stats that don't change, e.g. AC.
+        hp: Current hit points of each copy.
+        max_hp: Max hit points of each copy.
+        conditions: Bitmask of the `Condition`s on each copy.
+        death_save_failures: Number of failed death saving throws of each copy.
+        death_save_successes: Number of successful death saving throws of each copy.
+    """
+
+    template: Creature
+    hp: np.ndarray
+    max_hp: np.ndarray
+    conditions: np.ndarray
+    death_save_failures: np.ndarray
+    death_save_successes: np.ndarray
+    _damage_numerators: np.ndarray = field(init=False, repr=False)
+    _damage_denominators: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Indexed by `DamageType`, like `AttackDamage.amounts`
+        scales = np.array(
+            [_RESPONSE_SCALES[response] for response in self.template._damage_responses]
+        )
+        self._damage_numerators = scales[:, 0]
+        self._damage_denominators = scales[:, 1]
+
+    def __len__(self) -> int:
+        return len(self.hp)
+
+    @classmethod
+    def from_template(
+        cls, creature: Creature, size: int, rng: Optional[np.random.Generator] = None
+    ) -> CreatureBatch:
+        """Create `size` fresh copies of a creature, rolling hit points for each like `spawn`."""
+        if creature.num_hit_die is not None:
+            con_mod = creature.abilities.get_modifier(Ability.con)
+            rolled = roll_batch(creature.num_hit_die, creature.hit_die, size, rng=rng)
+            hp = np.maximum(rolled + con_mod * creature.num_hit_die, 1)
+        else:
+            hp = np.full(size, creature.max_hp)
+
+        return cls(
+            template=creature,
+            hp=hp,
+            max_hp=hp.copy(),
+            conditions=np.zeros(size, dtype=np.int64),
+            death_save_failures=np.zeros(size, dtype=np.int64),
+            death_save_successes=np.zeros(size, dtype=np.int64),
+        )
+
+    @property
+    def alive(self) -> np.ndarray:
+        """Boolean mask of which copies aren't dead."""
+        return (self.conditions & Condition.dead) == 0
+
+    @property
+    def conscious(self) -> np.ndarray:
+        """Boolean mask of which copies can act, i.e. aren't dead or unconscious."""
+        return (self.conditions & (Condition.dead | Condition.unconscious)) == 0
+
+    def roll_death_saves(
+        self, rolling: np.ndarray, rng: Optional[np.random.Generator] = None
+    ) -> None:
+        """Roll a death saving throw for every dying copy where `rolling` is True, mirroring
+        `Creature.roll_death_save`.
+        """
+        dying = rolling & ((self.conditions & Condition.dying) != 0)
+        if not dying.any():
+            return
+
+        d20 = roll_d20_batch(len(self), rng=rng)
+        # A natural 1 counts as two failures
+        self.death_save_failures += np.where(dying, np.select([d20 == 1, d20 < 10], [2, 1], 0), 0)
+        succeeded = dying & (d20 >= 10) & (d20 < 20)
+        self.death_save_successes += succeeded
+        stabilised = succeeded & (self.death_save_successes >= 3)
+        # A natural 20 regains 1 hit point and wakes up
+        revived = dying & (d20 == 20)
+        self.hp[revived] = np.minimum(self.hp[revived] + 1, self.max_hp[revived])
+
+        self.conditions[stabilised] |= Condition.stable
+        reset = stabilised | revived
+        self.death_save_failures[reset] = 0
+        self.death_save_successes[reset] = 0
+        self.conditions[reset] &= ~Condition.dying
+        self.conditions[revived] &= ~Condition.unconscious
+
+        dies = dying & (self.death_save_failures >= 3)
+        self.conditions[dies] |= Condition.dead
+        self.conditions[dies] &= ~(Condition.dying | Condition.unconscious)
+
+    def take_damage(self, damages: np.ndarray, crit: Optional[np.ndarray] = None) -> np.ndarray:
+        """Apply damage to every copy at once, mirroring `Creature.get_damage_taken` followed by
+        `Creature.take_damage`.
+
+        Args:
+            damages: Damage of each type dealt to each copy, of shape `(len(self), N_DAMAGE_TYPES)`
+                and indexed by `DamageType`. Copies left with no damage after immunities and
+                resistances aren't affected.
+            crit: Optional boolean mask of which hits were crits, which count as two failed death
+                saves against a dying creature.
+
+        Returns:
+            The total damage taken by each copy after immunities, resistances and vulnerabilities.
+        """
+        total = (damages * self._damage_numerators // self._damage_denominators).sum(axis=1)
+        # Like `Encounter`, damage that's fully resisted or ignored doesn't count as a hit
+        hit = (total > 0) & self.alive
+        total = np.where(hit, total, 0)
+
+        damage_taken = np.minimum(total, self.hp)
+        self.hp -= damage_taken
+        instant_death = hit & (total - damage_taken > self.max_hp)
+        down = hit & ~instant_death & (self.hp == 0)
+
+        # Already making death saving throws, get failure(s) instead of damage
+        dying = down & ((self.conditions & Condition.dying) != 0)
+        failures = np.where(crit, 2, 1) if crit is not None else 1
+        self.death_save_failures += np.where(dying, failures, 0)
+        dies = instant_death | (dying & (self.death_save_failures >= 3))
+
+        knocked_out = down & ~dying
+        if self.template.make_death_saves:
+            self.conditions[knocked_out] |= Condition.unconscious | Condition.dying
+        else:
+            dies |= knocked_out
+
+        self.conditions[dies] |= Condition.dead
+        self.conditions[dies] &= ~(Condition.dying | Condition.unconscious)
+
+        return total
+
+
+def simulate_duels(
+    creature1: Creature,
+    creature2: Creature,
+    num_battles: int,
+    max_rounds: int = 100,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """Run many simplified 1v1 fights to the death at once, with every battle a row of two
+    `CreatureBatch`es.
+
+    Both creatures start in melee and attack with their best melee weapon `num_attacks` times a
+    round, in initiative order. Dying copies roll death saves at the start of their turn and
+    unconscious ones don't act, but movement, traits and other conditions are ignored, so this is
+    much faster than `MultiEncounter1v1` but only an estimate.
+
+    Returns:
+        The winner of each battle: 0 for `creature1`, 1 for `creature2` or -1 if both are still
+        standing after `max_rounds`.
+    """
+    batches = [
+        CreatureBatch.from_template(creature1, num_battles, rng=rng),
+        CreatureBatch.from_template(creature2, num_battles, rng=rng),
+    ]
+    # Creature 1 goes first in a battle if it wins initiative, including ties
+    initiatives = [
+        roll_d20_batch(num_battles, rng=rng) + creature.abilities.get_modifier(Ability.dex)
+        for creature in (creature1, creature2)
+    ]
+    first = initiatives[0] >= initiatives[1]
+
+    # Each round creature 1 attacks where it goes first, then creature 2, then creature 1 where
+    # it goes second
+    turns = [(0, first), (1, None), (0, ~first)]
+    for _ in range(max_rounds):
+        for attacker_index, turn_mask in turns:
+            attacker = batches[attacker_index]
+            target = batches[1 - attacker_index]
+            in_progress = attacker.alive & target.alive
+            if turn_mask is not None:
+                in_progress &= turn_mask
+            if not in_progress.any():
+                continue
+
+            # Like `Creature.start_turn`, dying copies roll a death save before anything else
+            attacker.roll_death_saves(in_progress, rng=rng)
+            attacking = in_progress & attacker.conscious
+            if attacking.any():
+                _attack_batch(attacker, target, attacking, rng=rng)
+
+        if not (batches[0].alive & batches[1].alive).any():
+            break
+
+    return np.select([~batches[1].alive, ~batches[0].alive], [0, 1], default=-1)
+
+
+def _attack_batch(
+    attacker: CreatureBatch,
+    target: CreatureBatch,
+    attacking: np.ndarray,
+    rng: Optional[np.random.Generator] = None,
+) -> None:
+    """Make every attack of one turn, for each battle where `attacking` is True."""
+    creature = attacker.template
+    weapon = creature._best_melee_weapon
+    if weapon is None:
+        return
+
+    for _ in range(creature.num_attacks):
+        damages, crits = weapon.simulate(
+            len(attacker),
+            target_ac=target.template.ac,
+            to_hit=creature._get_to_hit_modifier(weapon),
+            damage_modifier=creature._get_attack_modifier(weapon),
+            two_handed=creature._two_hands_free,
+            rng=rng,
+            by_type=True,
+            return_crits=True,
+        )
+        # Attackers knocked out mid-turn can't keep attacking
+        hitting = attacking & attacker.conscious
+        damages[~hitting] = 0
+        target.take_damage(damages, crit=crits & hitting)
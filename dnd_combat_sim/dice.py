@@ -1,25 +1,94 @@
 """Helper functions for simulating rolling dice."""
 
 import random
-from typing import Union
+from functools import lru_cache
+from typing import Optional, Sequence, TypeVar, Union
 
+import numpy as np
 
-def roll_d20(advantage: bool = False, disadvantage: bool = False, lucky: bool = False) -> int:
+# Generator shared by all individual rolls, so a whole simulation can be seeded in one place
+_rng = random.Random()
+# Bound once to skip the attribute lookup for every die rolled
+_random = _rng.random
+_choice = _rng.choice
+_choices = _rng.choices
+# Shared generator for vectorised rolls, so bulk simulations don't pay per-die Python overhead
+_np_rng = np.random.default_rng()
+# Probability mass functions already computed by `dice_pmf`, keyed by (num_dice, die_size)
+_pmf_cache: dict[tuple[int, int], np.ndarray] = {}
+
+T = TypeVar("T")
+
+
+def seed(value: Optional[int] = None) -> None:
+    """Seed the shared generators used for all dice rolls, e.g. for reproducible simulations."""
+    global _np_rng  # pylint: disable=global-statement
+    _rng.seed(value)
+    _np_rng = np.random.default_rng(value)
+
+
+def choice(options: Sequence[T], weights: Optional[Sequence[float]] = None) -> T:
+    """Pick one of several options at random, e.g. a target to attack, optionally weighted."""
+    if len(options) == 1:
+        return options[0]
+    if weights is None:
+        return _choice(options)
+    return _choices(options, weights=weights)[0]
+
+
+def roll_d20(
+    advantage: bool = False,
+    disadvantage: bool = False,
+    lucky: bool = False,
+    rng: Optional[random.Random] = None,
+) -> int:
     """Simulate rolling a d20, potentially applying special cases such as advantage or lucky."""
-    result = random.randint(1, 20)
+    # Scaling random() like `roll_dice`, since randint validates its arguments on every call
+    random_ = _random if rng is None else rng.random
+    result = int(random_() * 20) + 1
 
     if advantage:
-        result = max(result, random.randint(1, 20))
+        result = max(result, int(random_() * 20) + 1)
     elif disadvantage:
-        result = min(result, random.randint(1, 20))
+        result = min(result, int(random_() * 20) + 1)
 
     if lucky and result == 1:
-        return roll_d20(advantage=advantage, disadvantage=disadvantage, lucky=False)
+        return roll_d20(advantage=advantage, disadvantage=disadvantage, lucky=False, rng=rng)
 
     return result
 
 
-def roll(dice: Union[int, str], crit: bool = False, use_average: bool = False) -> float:
+def roll_d20_batch(
+    size: int,
+    advantage: bool = False,
+    disadvantage: bool = False,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """Roll a d20 `size` times in one vectorised call, taking the higher or lower of two rolls for
+    each trial if rolling with advantage or disadvantage.
+    """
+    if rng is None:
+        rng = _np_rng
+    if advantage == disadvantage:
+        return rng.integers(1, 21, size=size)
+
+    rolls = rng.integers(1, 21, size=(size, 2))
+    return rolls.max(axis=1) if advantage else rolls.min(axis=1)
+
+
+@lru_cache(maxsize=None)
+def parse_dice(dice: str) -> tuple[int, int]:
+    """Parse a string like '3d6' into a `(num_dice, die_size)` tuple, caching the result."""
+    num_dice, _, die_size = dice.partition("d")
+    return int(num_dice), int(die_size)
+
+
+def roll(
+    dice: Union[int, str],
+    crit: bool = False,
+    use_average: bool = False,
+    rng: Optional[random.Random] = None,
+) -> float:
     """Roll one or more dice with a given number of sides, e.g. for damage or healing.
 
     Args:
@@ -27,17 +96,93 @@ def roll(dice: Union[int, str], crit: bool = False, use_average: bool = False) -
             or a string like "4d6" to indicate rolling 4x 6-sided dice and summing the result.
         crit: If True, double the number of dice rolled.
         use_average: If True, use the average value of the dice instead of rolling.
+        rng: Optional generator to roll with instead of the shared one.
     """
     if isinstance(dice, str):
-        num_dice, max_roll = map(int, dice.split("d"))
+        num_dice, die_size = parse_dice(dice)
     else:
         num_dice = 1
-        max_roll = dice
+        die_size = dice
 
+    return roll_dice(num_dice, die_size, crit=crit, use_average=use_average, rng=rng)
+
+
+def roll_dice(
+    num_dice: int,
+    die_size: int,
+    crit: bool = False,
+    use_average: bool = False,
+    rng: Optional[random.Random] = None,
+) -> float:
+    """Roll `num_dice` dice with `die_size` sides, e.g. 4 and 6 for "4d6", and sum the result.
+
+    Fast path for `roll` when the dice have already been parsed, e.g. by `DamageRoll`.
+    """
     if crit:
         num_dice *= 2
 
     if use_average:
-        return (max_roll + 1) / 2 * num_dice
+        return (die_size + 1) / 2 * num_dice
+
+    # Scaling random() is several times faster than random.randint, which validates its arguments
+    # on every call. Start from num_dice since each die's result is offset by 1
+    random_ = _random if rng is None else rng.random
+    total = num_dice
+    for _ in range(num_dice):
+        total += int(random_() * die_size)
+    return total
+
+
+def roll_batch(
+    num_dice: int,
+    die_size: int,
+    size: int,
+    crit: bool = False,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """Roll `num_dice` dice with `die_size` sides `size` times in one vectorised call.
+
+    Args:
+        num_dice: Number of dice to roll and sum for each trial, e.g. 4 for "4d6".
+        die_size: Number of sides on each die, e.g. 6 for "4d6".
+        size: Number of independent trials to roll.
+        crit: If True, double the number of dice rolled.
+        rng: Optional numpy generator to draw from, e.g. for reproducible simulations.
+
+    Returns:
+        An integer array of shape `(size,)` with the summed result of each trial.
+    """
+    if rng is None:
+        rng = _np_rng
+    if crit:
+        num_dice *= 2
+
+    return rng.integers(1, die_size + 1, size=(size, num_dice)).sum(axis=1)
+
+
+def dice_pmf(num_dice: int, die_size: int) -> np.ndarray:
+    """Get the probability mass function for the sum of `num_dice` dice with `die_size` sides.
+
+    The distribution is the uniform pmf of a single die convolved with itself `num_dice` times,
+    which is computed in one go with an FFT and cached, so repeated analytic queries (e.g. expected
+    damage, or the chance of dealing at least X damage) don't need to roll any dice.
+
+    Returns:
+        A read-only array of length `num_dice * (die_size - 1) + 1`, where element `i` is the
+        probability of rolling a total of `num_dice + i`.
+    """
+    key = (num_dice, die_size)
+    if key in _pmf_cache:
+        return _pmf_cache[key]
+
+    length = num_dice * (die_size - 1) + 1
+    fft_size = 1 << (length - 1).bit_length()  # Next power of two, so the FFT doesn't wrap
+    die_pmf = np.full(die_size, 1 / die_size)
+    pmf = np.fft.irfft(np.fft.rfft(die_pmf, fft_size) ** num_dice, fft_size)[:length]
+    # Clean up floating point noise from the FFT
+    pmf = np.clip(pmf, 0, None)
+    pmf /= pmf.sum()
+    pmf.setflags(write=False)
 
-    return sum(random.randint(1, max_roll) for _ in range(num_dice))
+    _pmf_cache[key] = pmf
+    return pmf
@@ -1,6 +1,12 @@
 import logging
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 
+import numpy as np
+
+from dnd_combat_sim import dice
+
 from dnd_combat_sim.battle import Battle, Team
 from dnd_combat_sim.conditions import TempCondition
 from dnd_combat_sim.creature import Condition, Creature
@@ -22,6 +28,15 @@ from dnd_combat_sim.weapon import Weapon, AttackDamage, AttackRoll
 
 logger = logging.getLogger(__name__)
 
+# A creature with any of these conditions doesn't get a turn
+NO_TURN_CONDITIONS = (
+    Condition.dead
+    | Condition.paralyzed
+    | Condition.petrified
+    | Condition.stunned
+    | Condition.unconscious
+)
+
 
 class Encounter1v1:
     """Class to manage an encounter between two creatures."""
@@ -48,7 +63,7 @@ class Encounter1v1:
             for trait_name in creature.traits or []:
                 trait = TRAITS.get(trait_name)
                 if trait is None:
-                    logger.warning(f"Trait {trait_name} not implement.")
+                    logger.warning("Trait %s not implement.", trait_name)
                     continue
                 else:
                     trait = trait()
@@ -61,7 +76,7 @@ class Encounter1v1:
                 for trait_name in attack.traits or []:
                     trait = ATTACK_TRAITS.get(trait_name)
                     if trait is None:
-                        logger.warning(f"Trait {trait_name} not implement.")
+                        logger.warning("Trait %s not implement.", trait_name)
                         continue
                     else:
                         trait = trait()
@@ -128,16 +143,7 @@ class Encounter1v1:
             return enemy
 
         # Don't get a turn if have any of these conditions
-        if any(
-            condition in creature.conditions
-            for condition in [
-                Condition.dead,
-                Condition.paralyzed,
-                Condition.petrified,
-                Condition.stunned,
-                Condition.unconscious,
-            ]
-        ):
+        if creature.conditions & NO_TURN_CONDITIONS:
             return None
 
         # Choose what to do
@@ -174,7 +180,7 @@ class Encounter1v1:
             # 1. Choose who to attack, with which weapon, and optionally where to move first
             attack_plan = attacker.choose_attack([target])
             if attack_plan is None:
-                logger.info(f"{attacker.name} has no valid attacks left.")
+                logger.info("%s has no valid attacks left.", attacker.name)
                 break
             else:
                 target, weapon, thrown = attack_plan
@@ -273,8 +279,7 @@ class Encounter1v1:
 
         # Resolve modifiers from attack traits
         weapon_modifiers = {}
-        for trait_name in weapon.traits:
-            trait = self.weapon_traits[attacker][weapon][trait_name]
+        for trait in self.weapon_traits.get(attacker, {}).get(weapon, []):
             if isinstance(trait, OnRollAttackWeaponTrait):
                 reason, modifier = trait.on_roll_attack(
                     attacker=attacker,
@@ -284,19 +289,14 @@ class Encounter1v1:
                     weapon_modifiers[reason] = modifier
         # Resolve modifiers from creature traits
         attacker_modifiers = {}
-        for trait_name in attacker.traits:
-            trait = self.creature_traits[attacker][trait_name]
+        for trait in self.creature_traits.get(attacker, []):
             if isinstance(trait, OnRollAttackCreatureTrait):
-                true_or_false = trait.on_roll_attack(
-                    attacker,
-                    target=target,
-                    battle=self.battle,
+                attacker_modifiers.update(
+                    trait.on_roll_attack(attacker, target=target, battle=self.battle)
                 )
-                if true_or_false:
-                    attacker_modifiers[trait] = true_or_false
         # Resolve modifiers from conditions on the attacker
         attacker_condition_modifiers = {}
-        for condition in self.battle.temp_conditions[attacker]:
+        for condition in self.battle.temp_conditions[attacker].values():
             if condition.condition in {Condition.invisible, Condition.unseen}:
                 attacker_condition_modifiers["attacking_from_unseen"] = "advantage"
             elif condition.condition in {Condition.prone, Condition.poisoned, Condition.frightened}:
@@ -307,7 +307,7 @@ class Encounter1v1:
                 attacker_condition_modifiers["attacking_blinded"] = "disadvantage"
         # Resolve modifiers from conditions on the target
         target_condition_modifiers = {}
-        for condition in self.battle.temp_conditions[target]:
+        for condition in self.battle.temp_conditions[target].values():
             if condition.condition in {Condition.invisible, Condition.unseen}:
                 target_condition_modifiers["target_unseen"] = "disadvantage"
             elif condition.condition == Condition.blinded and not target.senses:
@@ -353,8 +353,7 @@ class Encounter1v1:
     ) -> tuple[AttackDamage, list[OnRollDamageTrait]]:
         """Apply any attacker traits that modify the AttackDamage, e.g. Martial Advantage."""
         traits_applied = []
-        for trait_name in attacker.traits:
-            trait = self.creature_traits[attacker][trait_name]
+        for trait in self.creature_traits.get(attacker, []):
             if isinstance(trait, OnRollDamageTrait):
                 attack_damage, applied = trait.on_roll_damage(
                     attacker,
@@ -369,8 +368,7 @@ class Encounter1v1:
         self, target: Creature, attack_damage: AttackDamage, damage_outcome: DamageOutcome
     ) -> DamageOutcome:
         """Apply target traits that trigger after taking damage, e.g. undead fortitude."""
-        for trait_name in target.traits:
-            trait = self.creature_traits[target][trait_name]
+        for trait in self.creature_traits.get(target, []):
             if isinstance(trait, OnTakeDamageTrait):
                 damage_outcome = trait.on_take_damage(
                     target,
@@ -381,25 +379,47 @@ class Encounter1v1:
 
     def _apply_weapon_hit_traits(
         self, attack: Weapon, attacker: Creature, target: Creature
-    ) -> Optional[TempCondition]:
-        """Apply any attack (weapon) traits that deal special effects on a hit."""
+    ) -> list[TempCondition]:
+        """Apply any attack (weapon) traits that deal special effects on a hit, returning any
+        conditions they cause.
+        """
         conditions = []
-        if attack.traits is not None:
-            for trait_name in attack.traits:
-                trait = self.weapon_traits[attacker][attack][trait_name]
-                if isinstance(trait, OnHitWeaponTrait):
-                    result = trait.on_attack_hit(attacker, target)
-                    if result is not None:
-                        conditions.append(result)
+        for trait in self.weapon_traits.get(attacker, {}).get(attack, []):
+            if isinstance(trait, OnHitWeaponTrait):
+                result = trait.on_attack_hit(attacker, target)
+                if result is not None:
+                    conditions.append(result)
         return conditions
 
 
+def _run_encounters(
+    creature1: Creature, creature2: Creature, num_runs: int, seed: Optional[int] = None
+) -> Counter[str]:
+    """Run a block of encounters, e.g. in a worker process, and tally the winners."""
+    if seed is not None:
+        dice.seed(seed)
+    wins: Counter[str] = Counter()
+    for _ in range(num_runs):
+        winner = Encounter1v1(creature1.spawn(), creature2.spawn()).run_encounter()
+        wins[winner.name if winner is not None else "Stalemate"] += 1
+    return wins
+
+
 class MultiEncounter1v1:
     """Class to simulate running an encounter multiple times."""
 
-    def __init__(self, creature1: Creature, creature2: Creature, num_runs: int = 1000):
+    def __init__(
+        self,
+        creature1: Creature,
+        creature2: Creature,
+        num_runs: int = 1000,
+        num_workers: int = 1,
+        seed: Optional[int] = None,
+    ):
         self.creatures = [creature1, creature2]
         self.num_runs = num_runs
+        self.num_workers = num_workers
+        self.seed = seed
         self.wins = {creature.name: 0 for creature in self.creatures}
 
     def run(self):
@@ -409,6 +429,20 @@ class MultiEncounter1v1:
         elif self.num_runs > 10:
             logging.getLogger().setLevel(logging.WARNING)
 
+        if self.num_workers > 1:
+            self._run_parallel()
+        else:
+            self._run_serial()
+
+        if self.num_runs > 1:
+            print("\n")
+            for creature, wins in self.wins.items():
+                print(f"{creature}: {wins} {'win(s)' if creature != 'Stalemate' else ''}")
+
+    def _run_serial(self):
+        if self.seed is not None:
+            dice.seed(self.seed)
+
         for i in range(self.num_runs):
             encounter = Encounter1v1(self.creatures[0].spawn(), self.creatures[1].spawn())
             encounter.logger.log_encounter(i)
@@ -422,7 +456,20 @@ class MultiEncounter1v1:
                 else:
                     self.wins["Stalemate"] += 1
 
-        if self.num_runs > 1:
-            print("\n")
-            for creature, wins in self.wins.items():
-                print(f"{creature}: {wins} {'win(s)' if creature != 'Stalemate' else ''}")
+    def _run_parallel(self):
+        """Split the runs into one block per worker, each with its own independent seed."""
+        block_size, remainder = divmod(self.num_runs, self.num_workers)
+        block_sizes = [block_size + (i < remainder) for i in range(self.num_workers)]
+        seeds = [
+            int(child.generate_state(1)[0])
+            for child in np.random.SeedSequence(self.seed).spawn(self.num_workers)
+        ]
+        with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+            futures = [
+                executor.submit(_run_encounters, *self.creatures, size, seed)
+                for size, seed in zip(block_sizes, seeds)
+                if size > 0
+            ]
+            for future in futures:
+                for name, wins in future.result().items():
+                    self.wins[name] = self.wins.get(name, 0) + wins
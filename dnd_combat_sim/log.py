@@ -1,4 +1,5 @@
 import logging
+import os
 from dnd_combat_sim.conditions import TempCondition
 
 from dnd_combat_sim.creature import Creature
@@ -9,8 +10,14 @@ from dnd_combat_sim.weapon import AttackDamage, AttackRoll
 
 logger = logging.getLogger(__name__)
 
-logging.basicConfig(format="%(message)s", level=logging.INFO)
+# Set e.g. DND_LOGLEVEL=WARNING to skip building per-attack log messages in bulk simulations
+_log_level = os.environ.get("DND_LOGLEVEL", "INFO").upper()
+# getLevelName maps known level names to their number, so anything else isn't a valid level
+_valid_log_level = isinstance(logging.getLevelName(_log_level), int)
+logging.basicConfig(format="%(message)s", level=_log_level if _valid_log_level else logging.INFO)
 logging.getLogger("asyncio").setLevel(logging.WARNING)
+if not _valid_log_level:
+    logger.warning("Unknown DND_LOGLEVEL %r, defaulting to INFO", os.environ["DND_LOGLEVEL"])
 
 
 class EncounterLogger:
@@ -39,6 +46,8 @@ class EncounterLogger:
         distance: float,
         dash: bool = False,
     ):
+        if not logger.isEnabledFor(logging.INFO):
+            return
         movement = "dashes" if dash else "moves"
         direction = "towards" if distance > 0 else "away from"
         new_distance = get_distance(new_position, target.position)
@@ -55,6 +64,8 @@ class EncounterLogger:
         attacker_condition_modifiers,
         target_condition_modifiers,
     ):
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         msg = ""
         span = ""
         if position_modifiers:
@@ -83,6 +94,8 @@ class EncounterLogger:
         modifiers: dict[str, bool],
         attack_roll: AttackRoll,
     ):
+        if not logger.isEnabledFor(logging.INFO):
+            return
         span = " while down" if Condition.dying in target.conditions else ""
         if thrown:
             msg = f"{attacker.name} throws {attack_roll.weapon.name} at {target.name}{span}"
@@ -106,6 +119,8 @@ class EncounterLogger:
         self.attack_str = msg
 
     def log_miss(self, attack_roll: AttackRoll):
+        if not logger.isEnabledFor(logging.INFO):
+            return
         self._log_and_pause(f"{self.attack_str}: rolls {attack_roll}: misses")
         self.attack_str = None
 
@@ -119,6 +134,8 @@ class EncounterLogger:
         damage_taken: AttackDamage,
         damage_outcome: DamageOutcome,
     ):
+        if not logger.isEnabledFor(logging.INFO):
+            return
         if damage_outcome == DamageOutcome.still_dying:
             if attack_damage.crit:
                 msg = "CRITS for 2 automatic death saving throws: "
@@ -2,12 +2,15 @@
 # pylint: disable=invalid-name
 
 from dataclasses import dataclass, field
-from enum import IntEnum, StrEnum, auto
+from enum import IntEnum, IntFlag, StrEnum, auto
 
 
-class Condition(StrEnum):
+class Condition(IntFlag):
     """Possible conditions, roughly sorted into themes.
 
+    Each condition is a separate bit, so the set of conditions on a creature is a single int and
+    checking for any of several conditions is one bitwise AND.
+
     - Charmed: Can't attack or target the charmer with any attack or negative effect. The charmer
         also has advantage on any social checks against the creature.
 
@@ -84,8 +87,16 @@ class DamageOutcome(StrEnum):
     still_dying = auto()  # If hit a creature already making death saving throws
 
 
-class DamageType(StrEnum):
-    """Different types of damage that can be inflicted in the game."""
+class DamageType(IntEnum):
+    """Different types of damage that can be inflicted in the game.
+
+    Values count up from 0, so a damage type can be used directly as an index into an array of
+    per-type damage amounts.
+    """
+
+    @staticmethod
+    def _generate_next_value_(name, start, count, last_values):
+        return count
 
     acid = auto()
     bludgeoning = auto()
@@ -57,7 +57,7 @@ from dnd_combat_sim.creature import Creature
 from dnd_combat_sim.dice import roll
 from dnd_combat_sim.rules import Ability, Condition, DamageOutcome, DamageType
 from dnd_combat_sim.traits.trait import Trait
-from dnd_combat_sim.utils import get_distance
+from dnd_combat_sim.utils import is_within_distance
 
 logger = logging.getLogger(__name__)
 
@@ -138,9 +138,9 @@ class PackTactics(OnRollAttackCreatureTrait):
         for ally in battle.get_allies(creature):
             if (
                 Condition.incapacitated not in ally.conditions
-                and get_distance(ally.position, target.position) <= 5
+                and is_within_distance(ally.position, target.position, 5)
             ):
-                logger.debug(f"{creature.name} attacks with advantage thanks to pack tactics!")
+                logger.debug("%s attacks with advantage thanks to pack tactics!", creature.name)
                 return {"pack_tactics": "advantage"}
         return {}
 
@@ -164,13 +164,15 @@ class MartialAdvantage(OnRollDamageTrait):
         allies = battle.get_allies(creature)
         for ally in allies:
             if Condition.incapacitated not in ally.conditions:
-                damage_type = list(damage_roll.damages.keys())[0]
+                damage_type = damage_roll.damage_types[0]
                 extra_damage = roll("2d6")
                 logger.debug(
-                    f"{creature.name} used martial advantage to roll an extra {extra_damage} "
-                    f"{damage_type} damage."
+                    "%s used martial advantage to roll an extra %s %s damage.",
+                    creature.name,
+                    extra_damage,
+                    damage_type.name,
                 )
-                damage_roll.damages[damage_type] += extra_damage
+                damage_roll.amounts[damage_type] += extra_damage
                 self.last_used = battle.round
                 applied = True
                 break
@@ -216,7 +218,7 @@ class UndeadFortitude(OnTakeDamageTrait):
         if damage.crit:
             logger.info("Undead fortitude overcome by crit")
             return damage_outcome
-        if DamageType.radiant in damage.damages:
+        if DamageType.radiant in damage.damage_types:
             logger.info("Undead fortitude overcome by radiant damage")
             return damage_outcome
 
@@ -227,12 +229,16 @@ class UndeadFortitude(OnTakeDamageTrait):
         if save >= dc:
             creature.heal(1)
             logger.info(
-                f"{creature.name} passed DC {dc} undead fortitude const save with a {save} and "
-                "reanimated! "
+                "%s passed DC %s undead fortitude const save with a %s and reanimated! ",
+                creature.name,
+                dc,
+                save,
             )
             return DamageOutcome.reanimated
 
-        logger.info(f"{creature.name} failed DC {dc} undead fortitude const save with a {save}.")
+        logger.info(
+            "%s failed DC %s undead fortitude const save with a %s.", creature.name, dc, save
+        )
 
         return damage_outcome
 
@@ -4,11 +4,15 @@ import abc
 import logging
 from typing import Optional
 from dnd_combat_sim.weapon import Weapon
-from dnd_combat_sim.conditions import TempCondition
+from dnd_combat_sim.conditions import (
+    GRAPPLE_CONTESTED_BY,
+    GRAPPLE_ESCAPE_ABILITIES,
+    TempCondition,
+)
 from dnd_combat_sim.creature import Creature
-from dnd_combat_sim.rules import Ability, Condition, Size, Skill
+from dnd_combat_sim.rules import Ability, Condition, Size
 from dnd_combat_sim.traits.trait import Trait
-from dnd_combat_sim.utils import get_distance
+from dnd_combat_sim.utils import is_within_distance
 
 logger = logging.getLogger(__name__)
 
@@ -57,10 +61,10 @@ class Adhesive(OnHitWeaponTrait):
                 target=target,
                 caused_by=attacker,
                 escape_dc=13,
-                escape_ability=[Skill.acrobatics, Skill.athletics],
+                escape_ability=GRAPPLE_ESCAPE_ABILITIES,
                 # TODO use these
                 escape_modifiers={"disadvantage": True},
-                contested_by=[Skill.athletics],
+                contested_by=GRAPPLE_CONTESTED_BY,
                 on_action=True,
             )
 
@@ -69,7 +73,7 @@ class Lance(OnRollAttackWeaponTrait):
     """Lance martial weapon. Has disadvantage when attacking within 5ft."""
 
     def on_roll_attack(self, attacker: Creature, target: Creature) -> dict[str, str]:
-        if get_distance(attacker, target) <= 5:
+        if is_within_distance(attacker.position, target.position, 5):
             return {"lance @ 5 ft": "disadvantage"}
         return {}
 
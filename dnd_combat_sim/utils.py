@@ -29,6 +29,13 @@ def get_distance(point1: Position, point2: Position) -> float:
     return ((point1.x - point2.x) ** 2 + (point1.y - point2.y) ** 2) ** 0.5
 
 
+def is_within_distance(point1: Position, point2: Position, distance: float) -> bool:
+    """Check whether two points are at most `distance` apart, without taking a square root."""
+    dx = point1.x - point2.x
+    dy = point1.y - point2.y
+    return dx * dx + dy * dy <= distance * distance
+
+
 def load_attacks(*args, **kwargs):
     """Load all attacks from the attacks.csv file."""
     # Weapons
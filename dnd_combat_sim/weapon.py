@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from dataclasses import dataclass
-from typing import Collection, Optional, Union
+import random
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
+from typing import Any, Collection, Optional, Union
 
-from dnd_combat_sim.dice import roll
+import numpy as np
+
+from dnd_combat_sim.dice import dice_pmf, parse_dice, roll_batch, roll_d20_batch, roll_dice
 from dnd_combat_sim.rules import DamageType, Size
 from dnd_combat_sim.utils import ATTACKS
 
+N_DAMAGE_TYPES = len(DamageType)
+# Damage types by name, for parsing damage strings with a plain dict lookup
+DAMAGE_TYPES: dict[str, DamageType] = {damage_type.name: damage_type for damage_type in DamageType}
+# How many times the weapon dice are multiplied for creatures larger than medium
+SIZE_MULTIPLIERS = {Size.large: 2, Size.huge: 3, Size.gargantuan: 4}
+
 
 class AttackRoll:
     """Class to represent the result of an attack roll to hit, including:
@@ -18,6 +27,8 @@ class AttackRoll:
     - whether the roll was a critical hit
     """
 
+    __slots__ = ("total", "rolled", "modifier", "is_crit", "weapon")
+
     def __init__(self, rolled: int, modifier: int, crit: bool, weapon: Weapon) -> None:
         self.total = rolled + modifier
         self.rolled = rolled
@@ -30,54 +41,106 @@ class AttackRoll:
         return f"{self.total} ({self.rolled} {symbol} {self.modifier})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DamageRoll:
-    """Class to represent a damage roll with an associated type, e.g. 3d6 thunder damage."""
+    """Class to represent a damage roll with an associated type, e.g. 3d6 thunder damage.
+
+    The dice string is parsed once on creation into `num_dice` and `die_size`, so rolling doesn't
+    need to re-parse it every time.
+    """
 
     dice: str
     damage_type: DamageType
+    num_dice: int = field(init=False, repr=False, compare=False)
+    die_size: int = field(init=False, repr=False, compare=False)
+    average: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        num_dice, die_size = parse_dice(self.dice)
+        object.__setattr__(self, "num_dice", num_dice)
+        object.__setattr__(self, "die_size", die_size)
+        object.__setattr__(self, "average", (die_size + 1) / 2 * num_dice)
 
     @classmethod
+    @lru_cache(maxsize=None)
     def from_str(cls, damage_str: str) -> DamageRoll:
-        """Parse a string like '3d6 thunder' into a `DamageRoll` object."""
-        dice, damage_type = damage_str.split(" ")
-        return cls(dice, DamageType[damage_type])
+        """Parse a string like '3d6 thunder' into a `DamageRoll` object, caching the result.
 
-    @property
-    def num_dice(self) -> int:
-        """Get the number of dice to roll."""
-        return int(self.dice.split("d")[0])
+        Damage rolls are frozen, so the same instance is safely shared between weapons.
+        """
+        dice, _, damage_type_str = damage_str.partition(" ")
+        damage_type = DAMAGE_TYPES.get(damage_type_str)
+        if damage_type is None:
+            raise ValueError(f"Unknown damage type in {damage_str!r}")
+        return cls(dice, damage_type)
 
-    @property
-    def die_size(self) -> int:
-        """Get the size of the dice to roll."""
-        return int(self.dice.split("d")[1])
+    def pmf(self, crit: bool = False) -> np.ndarray:
+        """Get the probability mass function of this damage roll, ignoring any modifiers.
+
+        Element `i` of the returned array is the probability of rolling a total of
+        `num_dice + i` (or `2 * num_dice + i` on a crit). See `dice.dice_pmf`.
+        """
+        num_dice = self.num_dice * 2 if crit else self.num_dice
+        return dice_pmf(num_dice, self.die_size)
 
     def __repr__(self) -> str:
-        return f"{self.dice} {str(self.damage_type)}"
+        return f"{self.dice} {self.damage_type.name}"
 
 
 class AttackDamage:
     """Class to represent the total damage deal from an attack that hits, including one or more
     damage types.
+
+    Amounts are stored in a fixed-size list indexed by `DamageType`, avoiding hashing the damage
+    type on every update.
     """
 
     def __init__(self, damages_rolled: list[tuple[int, DamageType]], crit: bool = False) -> None:
-        self.damages: dict[DamageType, int] = defaultdict(int)
+        self.amounts: list[Union[int, float]] = [0] * N_DAMAGE_TYPES
+        self.damage_types: list[DamageType] = []  # In the order they were rolled
         self.crit = crit
-        for damage_rolled in damages_rolled:
-            self.damages[damage_rolled[1]] += damage_rolled[0]
+        for amount, damage_type in damages_rolled:
+            self.amounts[damage_type] += amount
+            if damage_type not in self.damage_types:
+                self.damage_types.append(damage_type)
+
+    @classmethod
+    def single(
+        cls, amount: Union[int, float], damage_type: DamageType, crit: bool = False
+    ) -> AttackDamage:
+        """Create damage of a single type, skipping the merging of multiple damage rolls."""
+        attack_damage = cls.__new__(cls)
+        attack_damage.amounts = [0] * N_DAMAGE_TYPES
+        attack_damage.amounts[damage_type] = amount
+        attack_damage.damage_types = [damage_type]
+        attack_damage.crit = crit
+        return attack_damage
+
+    def copy(self) -> AttackDamage:
+        """Copy the damage, e.g. to modify it without changing the original roll."""
+        attack_damage = AttackDamage.__new__(AttackDamage)
+        attack_damage.amounts = self.amounts.copy()
+        attack_damage.damage_types = self.damage_types.copy()
+        attack_damage.crit = self.crit
+        return attack_damage
 
     def __repr__(self) -> str:
-        return " + ".join(f"{amount} {damage_type}" for damage_type, amount in self.damages.items())
+        return " + ".join(
+            f"{amount} {damage_type.name}" for damage_type, amount in self.damages.items()
+        )
+
+    @property
+    def damages(self) -> dict[DamageType, Union[int, float]]:
+        """Get a mapping of each damage type dealt to its amount, in the order they were rolled."""
+        return {damage_type: self.amounts[damage_type] for damage_type in self.damage_types}
 
     @property
-    def total(self) -> int:
+    def total(self) -> Union[int, float]:
         """Get the total damage dealt from all damage types."""
-        return sum(self.damages.values())
+        return sum(self.amounts)
 
 
-@dataclass(repr=False, eq=False)
+@dataclass(repr=False, eq=False, slots=True)
 class Weapon:
     """Base class for a weapon or natural attack that a creature can make.
 
@@ -97,9 +160,9 @@ class Weapon:
 
     name: str
     melee: bool = True
-    damage: Optional[Union[str, DamageRoll]] = None  # E.g. "1d8 bludgeoning"
-    two_handed_damage: Optional[Union[str, DamageRoll]] = None
-    bonus_damage: Optional[Union[str, DamageRoll]] = None
+    damage: Optional[DamageRoll] = None  # E.g. "1d8 bludgeoning"
+    two_handed_damage: Optional[DamageRoll] = None
+    bonus_damage: Optional[DamageRoll] = None
     range: Optional[tuple[int, int]] = None  # Normal range / long range, in feet
     is_weapon: bool = True  # If False assume a 'natural' weapon like claws, bite etc
     type: Optional[str] = None  # E.g. 'simple', 'martial', 'monster'
@@ -115,25 +178,59 @@ class Weapon:
     size: Size = Size.medium  # Creatures attack with disadvantage using a larger weapon
     proficient: bool = True  # Specific to the wielder - TODO move to Creature
     traits: Optional[Collection[str]] = None
+    _eq_key: tuple = field(init=False, repr=False)
+    # (damage roll, whether the wielder's damage modifier applies) for one and two-handed attacks
+    _damage_rolls: tuple[tuple[DamageRoll, bool], ...] = field(init=False, repr=False)
+    _two_handed_damage_rolls: tuple[tuple[DamageRoll, bool], ...] = field(init=False, repr=False)
+    _repr_parts: Optional[tuple[str, str]] = field(init=False, repr=False, default=None)
 
     def __post_init__(self) -> None:
-        if isinstance(self.damage, str):
-            self.damage = DamageRoll.from_str(self.damage)
-        if isinstance(self.two_handed_damage, str):
-            self.two_handed_damage = DamageRoll.from_str(self.two_handed_damage)
-        if isinstance(self.bonus_damage, str):
-            self.bonus_damage = DamageRoll.from_str(self.bonus_damage)
-
         # Assume 1 melee weapon, or roll default amount of ammo for ranged/thrown weapons
         if self.quantity is None:
             if self.thrown:
                 # See intro section of the Monster Manual
-                self.quantity = roll("2d4")
+                self.quantity = roll_dice(2, 4)
             elif not self.melee:  # Ranged
-                self.quantity = roll("2d10")
+                self.quantity = roll_dice(2, 10)
             else:
                 self.quantity = 1
 
+        # Don't consider weapons different if they have different amounts of ammo left
+        self._eq_key = tuple(
+            getattr(self, field_.name)
+            for field_ in fields(self)
+            if field_.init and field_.name != "quantity"
+        )
+
+        # Select the damage rolls once so rolling damage is a single loop without None checks
+        self._damage_rolls = self._select_damage_rolls(self.damage)
+        self._two_handed_damage_rolls = self._select_damage_rolls(
+            self.damage if self.two_handed_damage is None else self.two_handed_damage
+        )
+
+    def _select_damage_rolls(
+        self, damage_roll: Optional[DamageRoll]
+    ) -> tuple[tuple[DamageRoll, bool], ...]:
+        """Pair a main damage roll and any bonus damage with whether the damage modifier applies."""
+        bonus_damage = self.bonus_damage
+        if (
+            damage_roll is not None
+            and bonus_damage is not None
+            and damage_roll.damage_type == bonus_damage.damage_type
+            and damage_roll.die_size == bonus_damage.die_size
+        ):
+            # Same dice and damage type, so roll them together, e.g. 1d6 fire + 1d6 fire -> 2d6 fire
+            num_dice = damage_roll.num_dice + bonus_damage.num_dice
+            damage_roll = DamageRoll(f"{num_dice}d{damage_roll.die_size}", damage_roll.damage_type)
+            bonus_damage = None
+
+        damage_rolls = []
+        if damage_roll is not None:
+            damage_rolls.append((damage_roll, True))
+        if bonus_damage is not None:
+            damage_rolls.append((bonus_damage, False))
+        return tuple(damage_rolls)
+
     @classmethod
     def init(
         cls,
@@ -146,100 +243,226 @@ class Weapon:
 
         If size is larger than medium, increase the number of dice rolled for the damage.
         """
-        attack = ATTACKS.loc[key].to_dict()
+        template = cls._build_template(key, size, proficient)
+        # Always return a copy since quantity changes as ammo is used. If quantity is None, a fresh
+        # amount of ammo is rolled in __post_init__
+        return replace(template, quantity=quantity)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _build_template(key: str, size: Size, proficient: bool) -> Weapon:
+        """Get a weapon for a creature of a given size from `ATTACK_TEMPLATES`, caching the result.
+
+        The returned weapon is shared between callers, so it must not be mutated. Use `init` to get
+        a copy.
+        """
+        template = ATTACK_TEMPLATES[key]
 
         # Larger creatures use larger weapons which multiply the number of dice rolled.
         # See DMG 'Creating a Monster Stat Block' p278
-        if attack["is_weapon"] and size > Size.medium:
-            for damage in ["damage", "two_handed_damage"]:
-                if attack[damage] is None:
-                    continue
-                attack_details: str = attack[damage]
-                dice, damage_type = attack_details.split(" ")
-                num_dice, die_size = map(int, dice.split("d"))
-
-                if size == Size.large:
-                    num_dice = num_dice * 2
-                elif size == Size.huge:
-                    num_dice = num_dice * 3
-                elif size == Size.gargantuan:
-                    num_dice = num_dice * 4
-
-                attack[damage] = DamageRoll(f"{num_dice}d{die_size}", DamageType[damage_type])
-
-        attack["traits"] = attack["traits"].split(",") if attack["traits"] else None
-        range_long = attack.pop("range_long")
-        attack["range"] = (int(attack["range"]), int(range_long)) if attack["range"] else None
-        attack.update(dict(proficient=proficient, quantity=quantity, size=size))
-
-        return cls(**attack)
+        scaled_damages = {}
+        multiplier = SIZE_MULTIPLIERS.get(size, 1)
+        if template.is_weapon and multiplier != 1:
+            for damage in ("damage", "two_handed_damage"):
+                damage_roll: Optional[DamageRoll] = getattr(template, damage)
+                if damage_roll is not None:
+                    scaled_damages[damage] = DamageRoll(
+                        f"{damage_roll.num_dice * multiplier}d{damage_roll.die_size}",
+                        damage_roll.damage_type,
+                    )
+
+        return replace(template, proficient=proficient, size=size, **scaled_damages)
 
     def roll_damage(
         self,
         two_handed: bool = False,
         crit: bool = False,
         damage_modifier: int = 0,
-        use_average: bool = False,
+        rng: Optional[random.Random] = None,
     ) -> AttackDamage:
-        """Roll the (average) damage for this attack."""
-        all_damages = []
+        """Roll the damage for this attack, optionally with a specific generator.
 
-        damage_roll = self.damage
-        if two_handed and self.two_handed_damage is not None:
-            damage_roll = self.two_handed_damage
-        if damage_roll is not None:
-            damage_rolled = roll(damage_roll.dice, crit=crit, use_average=use_average)
-            damage_rolled = max(damage_rolled + damage_modifier, 0)  # Can't be negative
+        Always rolls whole numbers. See `expected_damage` for the average damage instead.
+        """
+        damage_rolls = self._two_handed_damage_rolls if two_handed else self._damage_rolls
+        all_damages = []
+        for damage_roll, modified in damage_rolls:
+            damage_rolled = roll_dice(
+                damage_roll.num_dice, damage_roll.die_size, crit=crit, rng=rng
+            )
+            if modified:
+                damage_rolled = max(damage_rolled + damage_modifier, 0)  # Can't be negative
             all_damages.append((damage_rolled, damage_roll.damage_type))
 
-        if self.bonus_damage is not None:
-            damage_rolled = roll(self.bonus_damage.dice, crit=crit, use_average=use_average)
-            all_damages.append((damage_rolled, self.bonus_damage.damage_type))
-
+        if len(all_damages) == 1:
+            return AttackDamage.single(*all_damages[0], crit=crit)
         return AttackDamage(all_damages, crit=crit)
 
+    def expected_damage(
+        self, two_handed: bool = False, crit: bool = False, damage_modifier: int = 0
+    ) -> float:
+        """Get the average total damage of this attack on a hit, for cheaply comparing weapons."""
+        damage_rolls = self._two_handed_damage_rolls if two_handed else self._damage_rolls
+        total = 0.0
+        for damage_roll, modified in damage_rolls:
+            # Crits double the dice rolled, so double the average
+            average = damage_roll.average * 2 if crit else damage_roll.average
+            if not modified:
+                total += average
+                continue
+
+            lowest = (damage_roll.num_dice * 2 if crit else damage_roll.num_dice) + damage_modifier
+            if lowest >= 0:
+                total += average + damage_modifier
+            else:
+                # Low rolls are clamped to 0 rather than going negative, so the closed form no
+                # longer holds. Average the clamped totals over the distribution instead
+                pmf = damage_roll.pmf(crit=crit)
+                totals = np.arange(lowest, lowest + len(pmf))
+                total += float(pmf @ np.maximum(totals, 0))
+        return total
+
+    def roll_damage_batch(
+        self,
+        num_trials: int,
+        two_handed: bool = False,
+        crit: bool = False,
+        damage_modifier: int = 0,
+        rng: Optional[np.random.Generator] = None,
+    ) -> np.ndarray:
+        """Roll the total damage for this attack `num_trials` times in one vectorised pass.
+
+        Mirrors `roll_damage`, but sums all damage types together, returning an integer array of
+        shape `(num_trials,)`. Useful for Monte Carlo estimates without a Python loop per roll.
+        """
+        damage_rolls = self._two_handed_damage_rolls if two_handed else self._damage_rolls
+        totals = np.zeros(num_trials, dtype=int)
+        for damage_roll, modified in damage_rolls:
+            rolled = roll_batch(
+                damage_roll.num_dice, damage_roll.die_size, num_trials, crit=crit, rng=rng
+            )
+            if modified:
+                rolled = np.maximum(rolled + damage_modifier, 0)  # Can't be negative
+            totals += rolled
+
+        return totals
+
+    def simulate(
+        self,
+        num_trials: int,
+        target_ac: int,
+        to_hit: int,
+        damage_modifier: int = 0,
+        two_handed: bool = False,
+        rng: Optional[np.random.Generator] = None,
+        by_type: bool = False,
+        return_crits: bool = False,
+    ) -> Union[np.ndarray, tuple[np.ndarray, np.ndarray]]:
+        """Simulate making this attack against a target `num_trials` times in one vectorised pass.
+
+        Rolls a d20 per trial, hitting if the roll plus `to_hit` meets `target_ac`. A natural 20
+        always hits and crits, doubling the damage dice, while a natural 1 always misses.
+
+        Returns:
+            An integer array of shape `(num_trials,)` with the damage dealt in each trial, or if
+            `by_type` is True, of shape `(num_trials, N_DAMAGE_TYPES)` indexed by `DamageType`.
+            If `return_crits` is True, also a boolean array of which trials crit.
+        """
+        d20 = roll_d20_batch(num_trials, rng=rng)
+        crit = d20 == 20
+        hit = ((d20 + to_hit >= target_ac) & (d20 != 1)) | crit
+        num_crits = int(crit.sum())
+
+        damage_rolls = self._two_handed_damage_rolls if two_handed else self._damage_rolls
+        totals = np.zeros((num_trials, N_DAMAGE_TYPES) if by_type else num_trials, dtype=int)
+        for damage_roll, modified in damage_rolls:
+            rolled = roll_batch(damage_roll.num_dice, damage_roll.die_size, num_trials, rng=rng)
+            # Crits roll the damage dice twice
+            rolled[crit] += roll_batch(
+                damage_roll.num_dice, damage_roll.die_size, num_crits, rng=rng
+            )
+            if modified:
+                rolled = np.maximum(rolled + damage_modifier, 0)  # Can't be negative
+            if by_type:
+                totals[:, damage_roll.damage_type] += rolled
+            else:
+                totals += rolled
+
+        damages = np.where(hit[:, None] if by_type else hit, totals, 0)
+        if return_crits:
+            return damages, crit
+        return damages
+
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Weapon):
-            return False
+        return isinstance(other, Weapon) and self._eq_key == other._eq_key
 
-        # Don't consider weapons different if they have different amounts of ammo left
-        return all(
-            getattr(self, attr) == getattr(other, attr)
-            for attr in self.__dict__
-            if attr != "quantity"
-        )
+    def __hash__(self) -> int:
+        return hash(self._eq_key)
 
     def __repr__(self) -> str:
-        size_str = f"{self.size.name.title()} " if self.size > Size.medium else ""
-        ret = f"{size_str}{self.name.title()}"
+        # Only the quantity changes after init, so the rest of the repr is built once and cached
+        if self._repr_parts is None:
+            self._repr_parts = self._build_repr_parts()
+        name_str, details_str = self._repr_parts
         if self.ammunition or self.thrown:
-            ret += f" x{self.quantity}"
-        ret += ":"
+            return f"{name_str} x{self.quantity}{details_str}"
+        return name_str + details_str
+
+    def _build_repr_parts(self) -> tuple[str, str]:
+        """Build the parts of the repr before and after the quantity."""
+        size_str = f"{self.size.name.title()} " if self.size > Size.medium else ""
+        name_str = size_str + self.name.title()
+
+        parts = [":"]
         if self.is_weapon:
             if self.type in ["simple", "martial"]:
-                ret += f" {self.type}"
-        ret += f" {'melee' if self.melee else 'ranged'} weapon,"
+                parts.append(f" {self.type}")
+        parts.append(f" {'melee' if self.melee else 'ranged'} weapon,")
 
         if self.melee:
-            ret += f" reach {10 if self.reach else 5} ft"
+            parts.append(f" reach {10 if self.reach else 5} ft")
             if self.thrown:
-                ret += f", {self.range[0]}/{self.range[1]} ft thrown"
+                parts.append(f", {self.range[0]}/{self.range[1]} ft thrown")
             else:
-                ret += ","
+                parts.append(",")
         else:
-            ret += f" range {self.range[0]}/{self.range[1]} ft"
+            parts.append(f" range {self.range[0]}/{self.range[1]} ft")
 
         if self.damage or self.two_handed_damage or self.bonus_damage:
-            ret += " "
+            parts.append(" ")
             if self.damage:
-                ret += repr(self.damage)
+                parts.append(repr(self.damage))
                 if self.two_handed_damage:
-                    ret += f" ({self.two_handed_damage.dice} two-handed)"
+                    parts.append(f" ({self.two_handed_damage.dice} two-handed)")
             elif self.two_handed_damage:
-                ret += repr(self.two_handed_damage)
+                parts.append(repr(self.two_handed_damage))
             if self.bonus_damage:
                 if self.damage or self.two_handed_damage:
-                    ret += " + "
-                ret += str(self.bonus_damage)
+                    parts.append(" + ")
+                parts.append(str(self.bonus_damage))
+
+        return name_str, "".join(parts)
+
+
+def _parse_attack(attack: dict[str, Any]) -> Weapon:
+    """Parse a row of _attacks.csv_ or _weapons.csv_ into a medium-sized `Weapon`."""
+    attack = dict(attack)
+    # Parse damage strings here rather than in Weapon.__post_init__, which also runs for every
+    # copy made by `dataclasses.replace`
+    for damage in ("damage", "two_handed_damage", "bonus_damage"):
+        if attack[damage]:
+            attack[damage] = DamageRoll.from_str(attack[damage])
+        else:
+            attack[damage] = None
+    attack["traits"] = tuple(attack["traits"].split(",")) if attack["traits"] else None
+    range_long = attack.pop("range_long")
+    attack["range"] = (int(attack["range"]), int(range_long)) if attack["range"] else None
+
+    return Weapon(**attack)
+
 
-        return ret
+# All attacks and weapons parsed once at import, so creating a weapon is a dict lookup rather than
+# a pandas lookup plus string parsing
+ATTACK_TEMPLATES: dict[str, Weapon] = {
+    key: _parse_attack(attack) for key, attack in ATTACKS.to_dict("index").items()
+}
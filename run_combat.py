@@ -12,6 +12,10 @@ if __name__ == "__main__":
     parser.add_argument("creature2", nargs="?", default="bullywug", choices=choices)
     parser.add_argument("-d", "--death_saves", action="store_true")
     parser.add_argument("-n", "--num_runs", type=int, default=1)
+    parser.add_argument(
+        "-w", "--num_workers", type=int, default=1, help="Processes to split the runs across"
+    )
+    parser.add_argument("-s", "--seed", type=int, default=None, help="Seed for reproducible runs")
     parser.add_argument("-m", "--monsters", action="store_true", help="List available monsters")
     args = parser.parse_args()
 
@@ -24,5 +28,11 @@ if __name__ == "__main__":
     creature1 = Creature.init(args.creature1, make_death_saves=args.death_saves, start_x=0)
     creature2 = Creature.init(args.creature2, make_death_saves=args.death_saves, start_x=100)
 
-    encounter = MultiEncounter1v1(creature1, creature2, num_runs=args.num_runs)
+    encounter = MultiEncounter1v1(
+        creature1,
+        creature2,
+        num_runs=args.num_runs,
+        num_workers=args.num_workers,
+        seed=args.seed,
+    )
     encounter.run()
@@ -1,9 +1,9 @@
 # pylint: disable=protected-access
 import random
 
-from dnd_combat_sim.weapon import Weapon
+from dnd_combat_sim.weapon import AttackDamage, Weapon
 from dnd_combat_sim.creature import Abilities, Creature
-from dnd_combat_sim.rules import Size
+from dnd_combat_sim.rules import Condition, DamageType, Size
 from dnd_combat_sim.utils import MONSTERS
 
 
@@ -60,3 +60,35 @@ class TestCreature:
 
 
         """
+
+    def test_get_damage_taken(self):
+        """Test immunities and resistances are applied per damage type."""
+        creature = Creature(
+            name="Test Creature",
+            ac=10,
+            hp=20,
+            cr=1,
+            immunities=["acid"],
+            resistances=[DamageType.piercing],
+        )
+        attack_damage = AttackDamage([(9, DamageType.piercing), (4, DamageType.acid)])
+
+        damage_taken, modifiers = creature.get_damage_taken(attack_damage)
+
+        assert damage_taken.total == 4
+        assert damage_taken.damages == {DamageType.piercing: 4}
+        assert modifiers == {DamageType.acid: "immune", DamageType.piercing: "resistant"}
+        # The original damage is left untouched
+        assert attack_damage.total == 13
+
+    def test_spawn_leaves_template_untouched(self):
+        """Test spawning from a dying creature doesn't roll death saves into the template."""
+        template = Creature.init("ogre", make_death_saves=True)
+        template.conditions |= Condition.dying | Condition.unconscious
+
+        for _ in range(5):
+            new_creature = template.spawn()
+            assert new_creature.conditions == Condition(0)
+            assert new_creature.death_saves == {"successes": 0, "failures": 0}
+
+        assert template.death_saves == {"successes": 0, "failures": 0}
@@ -0,0 +1,135 @@
+# pylint: disable=protected-access
+import numpy as np
+
+from dnd_combat_sim.creature import Creature
+from dnd_combat_sim.creature_batch import CreatureBatch, _attack_batch, simulate_duels
+from dnd_combat_sim.rules import Condition, DamageType
+from dnd_combat_sim.weapon import N_DAMAGE_TYPES
+
+
+def test_take_damage():
+    """Test damage is applied to every copy at once, matching the rules for a single creature."""
+    ## Arrange
+    creature = Creature(
+        name="Test Creature",
+        ac=10,
+        hp=20,
+        cr=1,
+        immunities=["acid"],
+        resistances=[DamageType.piercing],
+    )
+    batch = CreatureBatch.from_template(creature, 4)
+    damages = np.zeros((4, N_DAMAGE_TYPES), dtype=int)
+    damages[0, DamageType.piercing] = 9  # Resisted down to 4
+    damages[1, DamageType.acid] = 30  # Immune
+    damages[2, DamageType.slashing] = 25  # Killed
+    # Copy 3 isn't hit
+
+    ## Act
+    damage_taken = batch.take_damage(damages)
+
+    ## Assert
+    assert damage_taken.tolist() == [4, 0, 25, 0]
+    assert batch.hp.tolist() == [16, 20, 0, 20]
+    assert batch.alive.tolist() == [True, True, False, True]
+    assert Condition.dead in Condition(int(batch.conditions[2]))
+
+
+def test_take_damage_while_dying():
+    """Test a hit on a dying copy is a failed death save, or two if it's a crit."""
+    creature = Creature(name="Test Creature", ac=10, hp=20, cr=1, make_death_saves=True)
+    batch = CreatureBatch.from_template(creature, 2)
+    batch.hp[:] = 0
+    batch.conditions[:] = Condition.dying | Condition.unconscious
+    damages = np.zeros((2, N_DAMAGE_TYPES), dtype=int)
+    damages[:, DamageType.slashing] = 5
+
+    batch.take_damage(damages, crit=np.array([False, True]))
+
+    assert batch.death_save_failures.tolist() == [1, 2]
+    assert batch.alive.tolist() == [True, True]
+
+
+def test_take_damage_immune_while_dying():
+    """Test damage that's entirely ignored or resisted away doesn't count as a hit."""
+    creature = Creature(
+        name="Test Creature",
+        ac=10,
+        hp=20,
+        cr=1,
+        immunities=["acid"],
+        resistances=[DamageType.piercing],
+        make_death_saves=True,
+    )
+    batch = CreatureBatch.from_template(creature, 2)
+    batch.hp[:] = 0
+    batch.conditions[:] = Condition.dying | Condition.unconscious
+    damages = np.zeros((2, N_DAMAGE_TYPES), dtype=int)
+    damages[0, DamageType.acid] = 50  # Immune, so no instant death either
+    damages[1, DamageType.piercing] = 1  # Resisted down to 0
+
+    damage_taken = batch.take_damage(damages, crit=np.array([True, True]))
+
+    assert damage_taken.tolist() == [0, 0]
+    assert batch.death_save_failures.tolist() == [0, 0]
+    assert batch.alive.tolist() == [True, True]
+
+
+def test_roll_death_saves():
+    """Test dying copies keep rolling death saves until they die, stabilise or wake up."""
+    ## Arrange
+    creature = Creature(name="Test Creature", ac=10, hp=20, cr=1, make_death_saves=True)
+    batch = CreatureBatch.from_template(creature, 1000)
+    batch.hp[:] = 0
+    batch.conditions[:] = Condition.dying | Condition.unconscious
+    rng = np.random.default_rng(0)
+
+    ## Act
+    for _ in range(10):
+        batch.roll_death_saves(np.ones(len(batch), dtype=bool), rng=rng)
+
+    ## Assert
+    assert not (batch.conditions & Condition.dying).any()
+    dead = ~batch.alive
+    stable = (batch.conditions & Condition.stable) != 0
+    revived = batch.conscious
+    assert (dead ^ stable ^ revived).all()
+    assert (batch.hp[revived] == 1).all()
+    assert (batch.conditions[stable] & Condition.unconscious).all()
+    assert 0.2 < dead.mean() < 0.6
+
+
+def test_unconscious_copies_dont_attack():
+    """Test only conscious copies make their attacks."""
+    ogre = Creature.init("ogre", make_death_saves=True)
+    attacker = CreatureBatch.from_template(ogre, 1000)
+    attacker.conditions[:500] = Condition.unconscious
+    target = CreatureBatch.from_template(Creature(name="Target", ac=0, hp=1000, cr=1), 1000)
+
+    _attack_batch(attacker, target, np.ones(1000, dtype=bool), rng=np.random.default_rng(0))
+
+    damaged = target.hp < target.max_hp
+    assert not damaged[:500].any()
+    assert damaged[500:].mean() > 0.9
+
+
+def test_simulate_duels():
+    """Test many duels run at once, and that a much stronger creature wins nearly all of them."""
+    ogre = Creature.init("ogre")
+    kobold = Creature.init("kobold")
+
+    winners = simulate_duels(ogre, kobold, 1000, rng=np.random.default_rng(0))
+
+    assert winners.shape == (1000,)
+    assert set(winners.tolist()) <= {-1, 0, 1}
+    assert (winners == 0).mean() > 0.9
+
+
+def test_simulate_duels_with_death_saves():
+    """Test duels between creatures that make death saves still mostly end with a winner."""
+    ogre = Creature.init("ogre", make_death_saves=True)
+    kobold = Creature.init("kobold", make_death_saves=True)
+
+    winners = simulate_duels(ogre, kobold, 1000, rng=np.random.default_rng(0))
+
+    assert (winners == 0).mean() > 0.8
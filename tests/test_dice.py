@@ -0,0 +1,40 @@
+import random
+
+import numpy as np
+
+from dnd_combat_sim.dice import dice_pmf, roll_d20, roll_d20_batch
+
+
+def test_dice_pmf():
+    """Test the probability mass function of summed dice matches the known distribution."""
+    pmf = dice_pmf(2, 6)  # Totals 2..12
+
+    assert len(pmf) == 11
+    assert np.isclose(pmf.sum(), 1)
+    assert np.isclose(pmf[7 - 2], 6 / 36)
+    assert np.isclose(pmf[0], 1 / 36)
+    # Expected value of 2d6 is 7
+    assert np.isclose((pmf * np.arange(2, 13)).sum(), 7)
+
+
+def test_roll_d20_batch():
+    """Test batched d20 rolls stay in range, and advantage/disadvantage shift the average."""
+    rolls = roll_d20_batch(10_000)
+    with_advantage = roll_d20_batch(10_000, advantage=True)
+    with_disadvantage = roll_d20_batch(10_000, disadvantage=True)
+
+    assert rolls.shape == (10_000,)
+    assert rolls.min() >= 1 and rolls.max() <= 20
+    # Expected values are 10.5 for a straight roll, 13.82 with advantage and 7.18 with disadvantage
+    assert with_disadvantage.mean() < rolls.mean() < with_advantage.mean()
+
+
+def test_roll_d20():
+    """Test single d20 rolls cover every face, and are reproducible with a seeded generator."""
+    rolls = [roll_d20() for _ in range(10_000)]
+    with_advantage = [roll_d20(advantage=True) for _ in range(10_000)]
+
+    assert set(rolls) == set(range(1, 21))
+    assert np.mean(rolls) < np.mean(with_advantage)
+    rng1, rng2 = random.Random(0), random.Random(0)
+    assert [roll_d20(rng=rng1) for _ in range(20)] == [roll_d20(rng=rng2) for _ in range(20)]
@@ -28,23 +28,28 @@ def test_grapple():
 
     ## Act
     # Pretend mimic attacks with pseudopod and that it hits
-    condition = encounter._apply_weapon_hit_traits(pseudopod, mimic, ogre)
-    encounter.battle.add_condition(condition)
+    conditions = encounter._apply_weapon_hit_traits(pseudopod, mimic, ogre)
+    for condition in conditions:
+        encounter.battle.add_condition(condition)
     # Pretend it's the next turn - the mimic should be able to attack with advantage
     modifiers, _auto_crit = encounter._get_attack_modifiers(pseudopod, mimic, ogre)
     # Assert
     # Check the mimic has the expected Grappler trait
-    assert len(mimic.traits) == 1
-    assert isinstance(mimic.traits[0], Grappler)
+    mimic_traits = encounter.creature_traits[mimic]
+    assert len(mimic_traits) == 1
+    assert isinstance(mimic_traits[0], Grappler)
     # Check pseudopod has the expected Adhesive trait
-    assert len(pseudopod.traits) == 1
-    assert isinstance(pseudopod.traits[0], Adhesive)
+    pseudopod_traits = encounter.weapon_traits[mimic][pseudopod]
+    assert len(pseudopod_traits) == 1
+    assert isinstance(pseudopod_traits[0], Adhesive)
 
     # Check the appropriate grappled temporary condition is returned
+    assert len(conditions) == 1
+    condition = conditions[0]
     assert isinstance(condition, TempCondition)
     assert condition.condition == Condition.grappled
     assert condition.target == ogre
     assert condition.caused_by == mimic
 
     # Check the mimic has advantage on its next attack
-    assert modifiers == {"advantage": True}
+    assert modifiers == {"advantage": "target_grappled"}
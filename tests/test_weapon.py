@@ -1,6 +1,66 @@
+from itertools import product
+
+import numpy as np
+
 from dnd_combat_sim.weapon import Weapon
 
 
 class TestWeapon:
     def test_weapon_init(self):
         weapon = Weapon.init("pseudopod")
+
+    def test_roll_damage_batch(self):
+        """Test batched damage rolls stay within the bounds of the damage dice."""
+        weapon = Weapon.init("bite_d8_acid")  # 1d8 piercing + 1d8 acid
+
+        damages = weapon.roll_damage_batch(1000, damage_modifier=2)
+        crit_damages = weapon.roll_damage_batch(1000, crit=True)
+
+        assert damages.shape == (1000,)
+        assert damages.min() >= 4 and damages.max() <= 18
+        assert crit_damages.min() >= 4 and crit_damages.max() <= 32
+
+    def test_simulate(self):
+        """Test simulated attacks only deal damage on a hit, and always hit on a natural 20."""
+        weapon = Weapon.init("bite_d8_acid")  # 1d8 piercing + 1d8 acid
+
+        damages = weapon.simulate(10000, target_ac=15, to_hit=4, damage_modifier=2)
+        misses = weapon.simulate(1000, target_ac=30, to_hit=0)
+
+        assert damages.shape == (10000,)
+        assert damages.min() == 0 and damages.max() <= 34
+        assert 0.4 < (damages > 0).mean() < 0.6  # Hit on 11+
+        assert (misses == 0).mean() > 0.9  # Only crits hit
+        assert misses.max() >= 4
+
+    def test_simulate_crits(self):
+        """Test the crit mask lines up with the damage, and that every crit hits."""
+        weapon = Weapon.init("bite_d8_acid")  # 1d8 piercing + 1d8 acid
+
+        damages, crits = weapon.simulate(10000, target_ac=30, to_hit=0, return_crits=True)
+
+        assert crits.shape == damages.shape
+        assert 0.03 < crits.mean() < 0.07  # Only natural 20s hit
+        assert (damages[crits] >= 4).all()
+        assert (damages[~crits] == 0).all()
+
+    def test_expected_damage(self):
+        """Test expected damage averages the dice, doubling them on a crit."""
+        weapon = Weapon.init("bite_d8_acid")  # 1d8 piercing + 1d8 acid
+
+        assert weapon.expected_damage(damage_modifier=2) == 11
+        assert weapon.expected_damage(damage_modifier=-10) == 4.5  # Bonus damage isn't modified
+        assert weapon.expected_damage(crit=True) == 18
+
+    def test_expected_damage_clamped(self):
+        """Test expected damage matches enumerating every roll when penalties can clamp it to 0."""
+        weapon = Weapon.init("greatsword")  # 2d6 slashing, two-handed only
+
+        for crit in (False, True):
+            num_dice = 4 if crit else 2
+            outcomes = list(product(range(1, 7), repeat=num_dice))
+            for modifier in range(-10, 3):
+                brute_force = sum(max(sum(dice) + modifier, 0) for dice in outcomes) / len(outcomes)
+                assert np.isclose(
+                    weapon.expected_damage(True, crit=crit, damage_modifier=modifier), brute_force
+                )